@@ -49,6 +49,7 @@
 #endif
 
 #include <iostream>
+#include <string>
 
 #ifndef BUILD_BRIDGE
 # include "water/files/File.h"
@@ -783,6 +784,16 @@ static bool gVstWantsTime = false;
 // Current uniqueId for VST shell plugins
 static intptr_t gVstCurrentUniqueId = 0;
 
+// Reset the above before each check, server mode runs many of them in the same process
+static void reset_vst_state()
+{
+    gVstIsProcessing    = false;
+    gVstNeedsIdle       = false;
+    gVstWantsMidi       = false;
+    gVstWantsTime       = false;
+    gVstCurrentUniqueId = 0;
+}
+
 // Supported Carla features
 static intptr_t vstHostCanDo(const char* const feature)
 {
@@ -1519,19 +1530,16 @@ static void do_fluidsynth_check(const char* const filename, const bool doInit)
 #endif
 }
 
-// ------------------------------ main entry point ------------------------------
+// ------------------------------ discovery of a single file ------------------------------
 
-int main(int argc, char* argv[])
+static int do_discovery(const char* const stype, const char* const filename)
 {
-    if (argc != 3)
-    {
-        carla_stdout("usage: %s <type> </path/to/plugin>", argv[0]);
-        return 1;
-    }
+    const PluginType type = getPluginTypeFromString(stype);
 
-    const char* const stype    = argv[1];
-    const char* const filename = argv[2];
-    const PluginType  type     = getPluginTypeFromString(stype);
+#ifndef USE_JUCE_PROCESSORS
+    // do not let the previous plugin's callback requests leak into this one
+    reset_vst_state();
+#endif
 
     CarlaString filenameCheck(filename);
     filenameCheck.toLower();
@@ -1560,19 +1568,6 @@ int main(int argc, char* argv[])
         openLib = false;
 #endif
 
-    // ---------------------------------------------------------------------
-    // Initialize OS features
-
-#ifdef CARLA_OS_WIN
-    OleInitialize(nullptr);
-    CoInitializeEx(nullptr, COINIT_APARTMENTTHREADED);
-# ifndef __WINPTHREADS_VERSION
-    // (non-portable) initialization of statically linked pthread library
-    pthread_win32_process_attach_np();
-    pthread_win32_thread_attach_np();
-# endif
-#endif
-
     // ---------------------------------------------------------------------
 
     if (openLib)
@@ -1671,6 +1666,60 @@ int main(int argc, char* argv[])
     if (openLib && handle != nullptr)
         lib_close(handle);
 
+    return 0;
+}
+
+// ------------------------------ main entry point ------------------------------
+
+int main(int argc, char* argv[])
+{
+    const bool serverMode = (argc == 2 && std::strcmp(argv[1], "--server") == 0);
+
+    if (argc != 3 && ! serverMode)
+    {
+        carla_stdout("usage: %s <type> </path/to/plugin>", argv[0]);
+        carla_stdout("       %s --server", argv[0]);
+        return 1;
+    }
+
+    // ---------------------------------------------------------------------
+    // Initialize OS features
+
+#ifdef CARLA_OS_WIN
+    OleInitialize(nullptr);
+    CoInitializeEx(nullptr, COINIT_APARTMENTTHREADED);
+# ifndef __WINPTHREADS_VERSION
+    // (non-portable) initialization of statically linked pthread library
+    pthread_win32_process_attach_np();
+    pthread_win32_thread_attach_np();
+# endif
+#endif
+
+    // ---------------------------------------------------------------------
+
+    int ret = 0;
+
+    if (serverMode)
+    {
+        // read "type" and "filename" lines from stdin until it gets closed,
+        // each request is finished with a "done" line so the caller knows when to stop reading
+        std::string stype, filename;
+
+        while (std::getline(std::cin, stype) && std::getline(std::cin, filename))
+        {
+            do_discovery(stype.c_str(), filename.c_str());
+            DISCOVERY_OUT("done", "----------");
+
+            // the LV2 world can only load a single bundle per process, quit so the next check starts fresh
+            if (getPluginTypeFromString(stype.c_str()) == PLUGIN_LV2)
+                break;
+        }
+    }
+    else
+    {
+        ret = do_discovery(argv[1], argv[2]);
+    }
+
     // ---------------------------------------------------------------------
 
 #ifdef CARLA_OS_WIN
@@ -1682,7 +1731,7 @@ int main(int argc, char* argv[])
     OleUninitialize();
 #endif
 
-    return 0;
+    return ret;
 }
 
 // --------------------------------------------------------------------------
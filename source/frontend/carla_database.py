@@ -19,10 +19,15 @@
 # ---------------------------------------------------------------------------------------------------------------------
 # Imports (Global)
 
-from copy import deepcopy
+import json
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from subprocess import Popen, PIPE
+from threading import Event, Lock
+from time import monotonic
 
-from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QEventLoop, QThread, QSettings
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QEventLoop, QThread, QSettings, QTimer
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import QApplication, QDialog, QDialogButtonBox, QHeaderView, QTableWidgetItem
 
@@ -45,7 +50,6 @@ if WINDOWS:
 elif not CXFREEZE:
     try:
         import ladspa_rdf
-        import json
         haveLRDF = True
     except:
         qWarning("LRDF Support not available (LADSPA-RDF will be disabled)")
@@ -69,40 +73,118 @@ if haveLRDF and readEnvVars:
 # ---------------------------------------------------------------------------------------------------------------------
 # Plugin Query (helper functions)
 
+# directory listings of the current plugin search, so paths shared between plugin types are only read once
+gWalkCache = None
+
+def setWalkCacheEnabled(enabled):
+    global gWalkCache
+    gWalkCache = {} if enabled else None
+
+def scanDir(path):
+    if gWalkCache is not None and path in gWalkCache:
+        return gWalkCache[path]
+
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        entries = None
+
+    if entries is None:
+        listing = None
+
+    else:
+        dirs  = []
+        files = []
+        links = set()
+
+        for entry in entries:
+            try:
+                isDir = entry.is_dir()
+            except OSError:
+                isDir = False
+
+            if isDir:
+                dirs.append(entry.name)
+                if entry.is_symlink():
+                    links.add(entry.name)
+            else:
+                files.append(entry.name)
+
+        listing = (tuple(dirs), tuple(files), frozenset(links))
+
+    if gWalkCache is not None:
+        gWalkCache[path] = listing
+
+    return listing
+
+def walkPath(path, followlinks=False):
+    # same as os.walk(), but re-uses the file type information from os.scandir() instead of doing a stat per entry
+    stack = [path]
+
+    while stack:
+        root = stack.pop()
+        listing = scanDir(root)
+
+        if listing is None:
+            continue
+
+        # listings might be cached, give the caller its own lists to modify
+        dirs  = list(listing[0])
+        files = list(listing[1])
+        links = frozenset() if followlinks else listing[2]
+
+        yield root, dirs, files
+
+        prefix = walkPrefix(root)
+
+        # "dirs" might have been modified by the caller, only go into what's left (keeping os.walk order)
+        for name in reversed(dirs):
+            if name not in links:
+                stack.append(prefix + name)
+
+# plain string concatenation is a lot cheaper than os.path.join, roots only end with a separator at the top level
+def walkPrefix(root):
+    return root if root.endswith((os.sep, os.altsep or os.sep)) else root + os.sep
+
 def findBinaries(binPath, pluginType, OS):
     binaries = []
 
+    # extensions are matched in lowercase and without the dot, None means any file
     if OS == "HAIKU":
-        extensions = ("") if pluginType == PLUGIN_VST2 else (".so",)
+        extensions = None if pluginType == PLUGIN_VST2 else ("so",)
     elif OS == "MACOS":
-        extensions = (".dylib", ".so")
+        extensions = ("dylib", "so")
     elif OS == "WINDOWS":
-        extensions = (".dll",)
+        extensions = ("dll",)
     else:
-        extensions = (".so",)
+        extensions = ("so",)
 
-    for root, dirs, files in os.walk(binPath):
-        for name in tuple(name for name in files if name.lower().endswith(extensions)):
-            binaries.append(os.path.join(root, name))
+    for root, dirs, files in walkPath(binPath):
+        prefix = walkPrefix(root)
+        binaries += [prefix + name for name in files if extensions is None or
+                                                        ("." in name and name[name.rfind(".")+1:].lower() in extensions)]
 
     return binaries
 
 def findVST3Binaries(binPath):
     binaries = []
 
-    for root, dirs, files in os.walk(binPath):
-        for name in tuple(name for name in files if name.lower().endswith(".vst3")):
-            binaries.append(os.path.join(root, name))
+    for root, dirs, files in walkPath(binPath):
+        prefix = walkPrefix(root)
+        binaries += [prefix + name for name in files if name[-5:].lower() == ".vst3"]
 
     return binaries
 
 def findLV2Bundles(bundlePath):
     bundles = []
 
-    for root, dirs, files in os.walk(bundlePath, followlinks=True):
+    for root, dirs, files in walkPath(bundlePath, True):
         if root == bundlePath: continue
-        if os.path.exists(os.path.join(root, "manifest.ttl")):
+        if "manifest.ttl" in files:
             bundles.append(root)
+            # bundles are not nested, no need to look inside
+            dirs[:] = []
 
     return bundles
 
@@ -110,10 +192,16 @@ def findMacVSTBundles(bundlePath, isVST3):
     bundles = []
     extension = ".vst3" if isVST3 else ".vst"
 
-    for root, dirs, files in os.walk(bundlePath, followlinks=True):
+    for root, dirs, files in walkPath(bundlePath, True):
         #if root == bundlePath: continue # FIXME
-        for name in tuple(name for name in dirs if name.lower().endswith(extension)):
-            bundles.append(os.path.join(root, name))
+        pluginDirs = [name for name in dirs if name[-len(extension):].lower() == extension]
+
+        prefix = walkPrefix(root)
+        bundles += [prefix + name for name in pluginDirs]
+
+        # bundles are self-contained, no need to look inside
+        if pluginDirs:
+            dirs[:] = [name for name in dirs if name not in pluginDirs]
 
     return bundles
 
@@ -121,13 +209,13 @@ def findFilenames(filePath, stype):
     filenames = []
 
     if stype == "sf2":
-        extensions = (".sf2",".sf3",)
+        extensions = ("sf2","sf3",)
     else:
         return []
 
-    for root, dirs, files in os.walk(filePath):
-        for name in tuple(name for name in files if name.lower().endswith(extensions)):
-            filenames.append(os.path.join(root, name))
+    for root, dirs, files in walkPath(filePath):
+        prefix = walkPrefix(root)
+        filenames += [prefix + name for name in files if "." in name and name[name.rfind(".")+1:].lower() in extensions]
 
     return filenames
 
@@ -136,6 +224,7 @@ def findFilenames(filePath, stype):
 
 PLUGIN_QUERY_API_VERSION = 11
 
+# only contains immutable values, so a shallow copy is enough to make a new one
 PyPluginInfo = {
     'API': PLUGIN_QUERY_API_VERSION,
     'valid': False,
@@ -157,18 +246,65 @@ PyPluginInfo = {
     'parameters.outs': 0
 }
 
-gDiscoveryProcess = None
+# discovery properties that map directly to an integer PyPluginInfo key
+DISCOVERY_INT_PROPS = frozenset((
+    'build',
+    'hints',
+    'uniqueId',
+    'audio.ins',
+    'audio.outs',
+    'cv.ins',
+    'cv.outs',
+    'midi.ins',
+    'midi.outs',
+    'parameters.ins',
+    'parameters.outs'
+))
+
+# PyPluginInfo keys taken as-is from a cached plugin description, and their name in there
+CACHED_PLUGIN_KEYS = (
+    ('hints', 'hints'),
+    ('name', 'name'),
+    ('label', 'label'),
+    ('maker', 'maker'),
+    ('audio.ins', 'audioIns'),
+    ('audio.outs', 'audioOuts'),
+    ('cv.ins', 'cvIns'),
+    ('cv.outs', 'cvOuts'),
+    ('midi.ins', 'midiIns'),
+    ('midi.outs', 'midiOuts'),
+    ('parameters.ins', 'parameterIns'),
+    ('parameters.outs', 'parameterOuts')
+)
+
+# discovery processes currently running and when their check started, might be more than one as plugins are checked in parallel
+gDiscoveryProcesses = {}
+gDiscoveryProcessesLock = Lock()
+
+# processes stopped by killDiscovery, their files are given up on instead of being checked again
+gKilledDiscoveryProcesses = set()
+
+# idle discovery servers, per discovery command
+gDiscoveryServers = {}
+
+# plugins usually share a few parent dirs, so only check each of them once per search
+@lru_cache(maxsize=4096)
+def isWinePrefixDir(path):
+    return os.path.isdir(path + "/dosdevices")
 
 def findWinePrefix(filename, recursionLimit = 10):
-    if recursionLimit == 0 or len(filename) < 5 or "/" not in filename:
-        return ""
+    path = filename
+
+    for _ in range(recursionLimit):
+        if len(path) < 5 or "/" not in path:
+            break
 
-    path = filename[:filename.rfind("/")]
+        path = path[:path.rfind("/")]
 
-    if os.path.isdir(path + "/dosdevices"):
-        return path
+        if isWinePrefixDir(path):
+            return path
 
-    return findWinePrefix(path, recursionLimit-1)
+    return ""
 
 def runCarlaDiscovery(itype, stype, filename, tool, wineSettings=None):
     if not os.path.exists(tool):
@@ -208,44 +344,35 @@ def runCarlaDiscovery(itype, stype, filename, tool, wineSettings=None):
             command.append(wineCMD)
 
     command.append(tool)
-    command.append(stype)
-    command.append(filename)
 
-    global gDiscoveryProcess
-    gDiscoveryProcess = Popen(command, stdout=PIPE)
-
-    pinfo = None
-    plugins = []
-    fakeLabel = os.path.basename(filename).rsplit(".", 1)[0]
+    # re-use a running discovery tool if possible, instead of starting a new process for each file.
+    # the LV2 world can only load a single bundle per process, so those are always checked on their own
+    if itype == PLUGIN_LV2:
+        lines = None
+    else:
+        server = getDiscoveryServer(command)
 
-    while True:
         try:
-            line = gDiscoveryProcess.stdout.readline().decode("utf-8", errors="ignore")
-        except:
-            print("ERROR: discovery readline failed")
-            break
+            lines = server.query(stype, filename)
+        finally:
+            releaseDiscoveryServer(server)
 
-        # line is valid, strip it
-        if line:
-            line = line.strip()
+    if lines is None:
+        lines = runDiscoveryProcess(command + [stype, filename])
 
-        # line is invalid, try poll() again
-        elif gDiscoveryProcess.poll() is None:
-            continue
-
-        # line is invalid and poll() failed, stop here
-        else:
-            break
+    pinfo = None
+    plugins = []
+    fakeLabel = os.path.basename(filename).rsplit(".", 1)[0]
 
+    for line in lines:
         if line == "carla-discovery::init::-----------":
-            pinfo = deepcopy(PyPluginInfo)
+            pinfo = PyPluginInfo.copy()
             pinfo['type']     = itype
             pinfo['filename'] = filename if filename != ":all" else ""
 
         elif line == "carla-discovery::end::------------":
             if pinfo is not None:
                 plugins.append(pinfo)
-                del pinfo
                 pinfo = None
 
         elif line == "Segmentation fault":
@@ -254,96 +381,191 @@ def runCarlaDiscovery(itype, stype, filename, tool, wineSettings=None):
         elif line.startswith("err:module:import_dll Library"):
             print(line)
 
-        elif line.startswith("carla-discovery::info::"):
-            print("%s - %s" % (line, filename))
-
-        elif line.startswith("carla-discovery::warning::"):
-            print("%s - %s" % (line, filename))
+        elif line.startswith("carla-discovery::"):
+            # skip the "carla-discovery::" prefix, 17 chars
+            prop, sep, value = line[17:].partition("::")
 
-        elif line.startswith("carla-discovery::error::"):
-            print("%s - %s" % (line, filename))
+            if not sep:
+                continue
 
-        elif line.startswith("carla-discovery::"):
-            if pinfo == None:
+            if prop in ("info", "warning", "error"):
+                print("%s - %s" % (line, filename))
                 continue
 
-            try:
-                prop, value = line.replace("carla-discovery::", "").split("::", 1)
-            except:
+            if pinfo is None:
                 continue
 
-            if prop == "build":
-                if value.isdigit(): pinfo['build'] = int(value)
+            if prop in DISCOVERY_INT_PROPS:
+                if value.isdigit(): pinfo[prop] = int(value)
             elif prop == "name":
                 pinfo['name'] = value if value else fakeLabel
             elif prop == "label":
                 pinfo['label'] = value if value else fakeLabel
             elif prop == "maker":
                 pinfo['maker'] = value
-            elif prop == "uniqueId":
-                if value.isdigit(): pinfo['uniqueId'] = int(value)
-            elif prop == "hints":
-                if value.isdigit(): pinfo['hints'] = int(value)
-            elif prop == "audio.ins":
-                if value.isdigit(): pinfo['audio.ins'] = int(value)
-            elif prop == "audio.outs":
-                if value.isdigit(): pinfo['audio.outs'] = int(value)
-            elif prop == "cv.ins":
-                if value.isdigit(): pinfo['cv.ins'] = int(value)
-            elif prop == "cv.outs":
-                if value.isdigit(): pinfo['cv.outs'] = int(value)
-            elif prop == "midi.ins":
-                if value.isdigit(): pinfo['midi.ins'] = int(value)
-            elif prop == "midi.outs":
-                if value.isdigit(): pinfo['midi.outs'] = int(value)
-            elif prop == "parameters.ins":
-                if value.isdigit(): pinfo['parameters.ins'] = int(value)
-            elif prop == "parameters.outs":
-                if value.isdigit(): pinfo['parameters.outs'] = int(value)
             elif prop == "uri":
                 if value:
                     pinfo['label'] = value
                 else:
                     # cannot use empty URIs
-                    del pinfo
                     pinfo = None
                     continue
             else:
                 print("%s - %s (unknown property)" % (line, filename))
 
-    # FIXME?
-    tmp = gDiscoveryProcess
-    gDiscoveryProcess = None
-    del gDiscoveryProcess, tmp
-
     return plugins
 
+def runDiscoveryProcess(command):
+    discoveryProcess = Popen(command, stdout=PIPE, bufsize=65536, encoding="utf-8", errors="ignore")
+
+    with gDiscoveryProcessesLock:
+        gDiscoveryProcesses[discoveryProcess] = monotonic()
+
+    # let buffered text IO do the reading and decoding, stops when the pipe is closed
+    lines = [line.strip() for line in discoveryProcess.stdout]
+
+    discoveryProcess.stdout.close()
+    discoveryProcess.wait()
+
+    if finishDiscoveryProcess(discoveryProcess):
+        return []
+
+    return lines
+
+# stop tracking a process, returns True if it was killed on purpose
+def finishDiscoveryProcess(discoveryProcess):
+    with gDiscoveryProcessesLock:
+        gDiscoveryProcesses.pop(discoveryProcess, None)
+
+        if discoveryProcess not in gKilledDiscoveryProcesses:
+            return False
+
+        gKilledDiscoveryProcesses.discard(discoveryProcess)
+        return True
+
 def killDiscovery():
-    global gDiscoveryProcess
+    with gDiscoveryProcessesLock:
+        for discoveryProcess in gDiscoveryProcesses:
+            gKilledDiscoveryProcesses.add(discoveryProcess)
+            discoveryProcess.kill()
+
+# used to skip a plugin, the one that has been running for the longest time is most likely the one that is stuck
+def killOldestDiscovery():
+    with gDiscoveryProcessesLock:
+        if not gDiscoveryProcesses:
+            return
 
-    if gDiscoveryProcess is not None:
-        gDiscoveryProcess.kill()
+        discoveryProcess = min(gDiscoveryProcesses, key=gDiscoveryProcesses.get)
+        gKilledDiscoveryProcesses.add(discoveryProcess)
+        discoveryProcess.kill()
 
-def checkPluginCached(desc, ptype):
-    pinfo = deepcopy(PyPluginInfo)
-    pinfo['build'] = BINARY_NATIVE
-    pinfo['type']  = ptype
-    pinfo['hints'] = desc['hints']
-    pinfo['name']  = desc['name']
-    pinfo['label'] = desc['label']
-    pinfo['maker'] = desc['maker']
+# ---------------------------------------------------------------------------------------------------------------------
+# Discovery server, a carla-discovery process that stays alive and checks one file at a time
 
-    pinfo['audio.ins']  = desc['audioIns']
-    pinfo['audio.outs'] = desc['audioOuts']
+class DiscoveryServer(object):
+    def __init__(self, command):
+        self.fCommand   = command
+        self.fProcess   = None
+        self.fSupported = True
 
-    pinfo['cv.ins']  = desc['cvIns']
-    pinfo['cv.outs'] = desc['cvOuts']
+    # returns the output lines for this file, or None if it needs to be checked with a one-shot process instead
+    def query(self, stype, filename):
+        if not self.fSupported:
+            return None
 
-    pinfo['midi.ins']  = desc['midiIns']
-    pinfo['midi.outs'] = desc['midiOuts']
+        # (re)start the tool if this is the first check or it died during the previous one
+        if self.fProcess is None:
+            self.fProcess = Popen(self.fCommand + ["--server"], stdin=PIPE, stdout=PIPE,
+                                  bufsize=65536, encoding="utf-8", errors="ignore")
 
-    pinfo['parameters.ins']  = desc['parameterIns']
-    pinfo['parameters.outs'] = desc['parameterOuts']
+        discoveryProcess = self.fProcess
+        lines = []
+        done  = False
+
+        with gDiscoveryProcessesLock:
+            gDiscoveryProcesses[discoveryProcess] = monotonic()
+
+        try:
+            discoveryProcess.stdin.write("%s\n%s\n" % (stype, filename))
+            discoveryProcess.stdin.flush()
+        except OSError:
+            # the tool already quit, still read what it printed before that
+            pass
+
+        try:
+            for line in discoveryProcess.stdout:
+                line = line.strip()
+
+                if line == "carla-discovery::done::----------":
+                    done = True
+                    break
+
+                lines.append(line)
+
+        except (OSError, ValueError):
+            pass
+
+        killed = finishDiscoveryProcess(discoveryProcess)
+
+        # skipped or stopped by the user, do not check this file again
+        if killed:
+            self.close()
+            return lines if done else []
+
+        if done:
+            return lines
+
+        # crashed, a new process is started on the next check
+        self.close()
+
+        # old tools just print their usage and quit
+        if len(lines) != 0 and all(line.startswith("usage:") or not line for line in lines):
+            self.fSupported = False
+
+        # never use partial output, check this file again on its own instead.
+        # the crash might have been caused by something a previously checked plugin left behind
+        return None
+
+    def close(self):
+        if self.fProcess is None:
+            return
+
+        discoveryProcess = self.fProcess
+        self.fProcess = None
+
+        try:
+            discoveryProcess.stdin.close()
+        except OSError:
+            pass
+
+        discoveryProcess.stdout.close()
+        discoveryProcess.wait()
+
+def getDiscoveryServer(command):
+    with gDiscoveryProcessesLock:
+        servers = gDiscoveryServers.get(tuple(command))
+        if servers:
+            return servers.pop()
+
+    return DiscoveryServer(command)
+
+def releaseDiscoveryServer(server):
+    with gDiscoveryProcessesLock:
+        gDiscoveryServers.setdefault(tuple(server.fCommand), []).append(server)
+
+def stopDiscoveryServers():
+    with gDiscoveryProcessesLock:
+        servers = [server for serverList in gDiscoveryServers.values() for server in serverList]
+        gDiscoveryServers.clear()
+
+    for server in servers:
+        server.close()
+
+def checkPluginCached(desc, ptype):
+    pinfo = PyPluginInfo.copy()
+    pinfo['build'] = BINARY_NATIVE
+    pinfo['type']  = ptype
+    pinfo.update((key, desc[descKey]) for key, descKey in CACHED_PLUGIN_KEYS)
 
     if ptype == PLUGIN_LV2:
         pinfo['filename'], pinfo['label'] = pinfo['label'].split('/',1)
@@ -378,6 +600,85 @@ def checkFileSFZ(filename, tool):
 def checkAllPluginsAU(tool):
     return runCarlaDiscovery(PLUGIN_AU, "AU", ":all", tool)
 
+# ---------------------------------------------------------------------------------------------------------------------
+# Settings Helpers
+
+# same rules as QVariant::toBool(), without asking PyQt for a second conversion
+def valueToBool(value):
+    if isinstance(value, int):
+        return bool(value)
+    if isinstance(value, str):
+        return value.lower() not in ("", "0", "false")
+    return bool(value)
+
+def getSettingsBool(settings, key, default):
+    return valueToBool(settings.value(key, default))
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Plugin List Storage
+
+# plugin lists are stored as json files, one per type, instead of going through QSettings,
+# the settings file only keeps the storage version (and plugin counts for cached types)
+PLUGIN_LIST_VERSION = 1
+
+gPluginListDir = os.path.join(HOME, ".config", "falkTX", "CarlaPlugins4")
+
+def loadPluginList(settingsDB, key):
+    try:
+        with open(os.path.join(gPluginListDir, key + ".json"), 'rb') as fd:
+            plugins = json.loads(fd.read().decode("utf-8"))
+    except OSError:
+        # missing or unreadable, might not have been migrated yet (see migratePluginLists)
+        return toList(settingsDB.value("Plugins/" + key, []))
+    except ValueError:
+        return []
+
+    return plugins if isinstance(plugins, list) else []
+
+# returns False if the list could not be written
+def savePluginList(key, plugins):
+    filename = os.path.join(gPluginListDir, key + ".json")
+
+    try:
+        os.makedirs(gPluginListDir, exist_ok=True)
+
+        # write to a temporary file first, so readers never see a partial list
+        with open(filename + ".tmp", 'w') as fd:
+            json.dump(plugins, fd)
+        os.replace(filename + ".tmp", filename)
+
+    except (OSError, TypeError, ValueError) as e:
+        qWarning("Failed to save plugin list '%s': %s" % (filename, e))
+        return False
+
+    return True
+
+# move lists saved by older versions out of QSettings, only done once
+def migratePluginLists(settingsDB):
+    if settingsDB.value("PluginListVersion", 0, type=int) == PLUGIN_LIST_VERSION:
+        return
+
+    settingsDB.beginGroup("Plugins")
+
+    oldKeys = settingsDB.childKeys()
+    movedKeys = []
+
+    for key in oldKeys:
+        # a newer list was already saved by a search that ran after a failed migration
+        if os.path.exists(os.path.join(gPluginListDir, key + ".json")):
+            movedKeys.append(key)
+        # keep anything that could not be written, so it is tried again next time instead of being lost
+        elif savePluginList(key, toList(settingsDB.value(key, []))):
+            movedKeys.append(key)
+
+    for key in movedKeys:
+        settingsDB.remove(key)
+
+    settingsDB.endGroup()
+
+    if len(movedKeys) == len(oldKeys):
+        settingsDB.setValue("PluginListVersion", PLUGIN_LIST_VERSION)
+
 # ---------------------------------------------------------------------------------------------------------------------
 # Separate Thread for Plugin Search
 
@@ -387,8 +688,8 @@ class SearchPluginsThread(QThread):
     def __init__(self, parent, pathBinaries):
         QThread.__init__(self, parent)
 
-        self.fContinueChecking = False
-        self.fPathBinaries     = pathBinaries
+        self.fStopEvent    = Event()
+        self.fPathBinaries = pathBinaries
 
         self.fCheckNative  = False
         self.fCheckPosix32 = False
@@ -407,18 +708,16 @@ class SearchPluginsThread(QThread):
 
         if WINDOWS:
             toolNative = "carla-discovery-win64.exe" if kIs64bit else "carla-discovery-win32.exe"
-            self.fWineSettings = None
-
         else:
             toolNative = "carla-discovery-native"
 
-            settings = QSettings("falkTX", "Carla2")
-            self.fWineSettings = {
-                'executable'    : settings.value(CARLA_KEY_WINE_EXECUTABLE, CARLA_DEFAULT_WINE_EXECUTABLE, type=str),
-                'autoPrefix'    : settings.value(CARLA_KEY_WINE_AUTO_PREFIX, CARLA_DEFAULT_WINE_AUTO_PREFIX, type=bool),
-                'fallbackPrefix': settings.value(CARLA_KEY_WINE_FALLBACK_PREFIX, CARLA_DEFAULT_WINE_FALLBACK_PREFIX, type=str)
-            }
-            del settings
+        # read from settings when starting a search
+        self.fWineSettings = None
+        self.fPathLADSPA = []
+        self.fPathDSSI   = []
+        self.fPathVST2   = []
+        self.fPathVST3   = []
+        self.fPathSF2    = []
 
         self.fToolNative = os.path.join(pathBinaries, toolNative)
 
@@ -430,6 +729,21 @@ class SearchPluginsThread(QThread):
         self.fLastCheckValue  = 0
         self.fSomethingChanged = False
 
+        # how many discovery processes can run at once, CARLA_SERIAL_DISCOVERY=1 checks plugins one by one
+        if os.getenv("CARLA_SERIAL_DISCOVERY") == "1":
+            self.fMaxParallel = 1
+        else:
+            self.fMaxParallel = os.cpu_count() or 1
+
+        # binaries being checked right now and when they started, shown instead of the ones already done
+        self.fRunningBinaries = {}
+        self.fRunningBinariesLock = Lock()
+
+        # last progress sent to the GUI, see _pluginFileLook()
+        self.fLastLookPercent = -1
+        self.fLastLookText    = ""
+        self.fLastLookTime    = 0.0
+
         # -------------------------------------------------------------
 
     def hasSomethingChanged(self):
@@ -453,12 +767,23 @@ class SearchPluginsThread(QThread):
         self.fCheckSFZ    = sfz
 
     def stop(self):
-        self.fContinueChecking = False
+        self.fStopEvent.set()
 
     def run(self):
         settingsDB = QSettings("falkTX", "CarlaPlugins4")
+        migratePluginLists(settingsDB)
+        setWalkCacheEnabled(True)
+
+        # write everything to disk only once at the end, not after each plugin type
+        try:
+            self._searchPlugins(settingsDB)
+        finally:
+            setWalkCacheEnabled(False)
+            stopDiscoveryServers()
+            settingsDB.sync()
 
-        self.fContinueChecking = True
+    def _searchPlugins(self, settingsDB):
+        self.fStopEvent.clear()
         self.fCurCount = 0
 
         # looking for plugins via external discovery
@@ -538,7 +863,30 @@ class SearchPluginsThread(QThread):
         else:
             OS = "UNKNOWN"
 
-        if not self.fContinueChecking: return
+        # wine prefixes might have been created or removed since the last search
+        isWinePrefixDir.cache_clear()
+
+        # read all paths and wine settings once, instead of for every plugin type and binary tool
+        settings = QSettings("falkTX", "Carla2")
+
+        self.fPathLADSPA = toList(settings.value(CARLA_KEY_PATHS_LADSPA, CARLA_DEFAULT_LADSPA_PATH))
+        self.fPathDSSI   = toList(settings.value(CARLA_KEY_PATHS_DSSI, CARLA_DEFAULT_DSSI_PATH))
+        self.fPathVST2   = toList(settings.value(CARLA_KEY_PATHS_VST2, CARLA_DEFAULT_VST2_PATH))
+        self.fPathVST3   = toList(settings.value(CARLA_KEY_PATHS_VST3, CARLA_DEFAULT_VST3_PATH))
+        self.fPathSF2    = toList(settings.value(CARLA_KEY_PATHS_SF2, CARLA_DEFAULT_SF2_PATH))
+
+        # these are passed to the backend as a single string
+        lv2Path = splitter.join(toList(settings.value(CARLA_KEY_PATHS_LV2, CARLA_DEFAULT_LV2_PATH)))
+        sfzPath = splitter.join(toList(settings.value(CARLA_KEY_PATHS_SFZ, CARLA_DEFAULT_SFZ_PATH)))
+
+        if not WINDOWS:
+            self.fWineSettings = {
+                'executable'    : settings.value(CARLA_KEY_WINE_EXECUTABLE, CARLA_DEFAULT_WINE_EXECUTABLE, type=str),
+                'autoPrefix'    : getSettingsBool(settings, CARLA_KEY_WINE_AUTO_PREFIX, CARLA_DEFAULT_WINE_AUTO_PREFIX),
+                'fallbackPrefix': settings.value(CARLA_KEY_WINE_FALLBACK_PREFIX, CARLA_DEFAULT_WINE_FALLBACK_PREFIX, type=str)
+            }
+
+        if self.fStopEvent.is_set(): return
 
         self.fSomethingChanged = True
 
@@ -554,30 +902,29 @@ class SearchPluginsThread(QThread):
 
             if self.fCheckNative:
                 plugins = self._checkLADSPA(OS, self.fToolNative)
-                settingsDB.setValue("Plugins/LADSPA_native", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("LADSPA_native", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix32:
                 plugins = self._checkLADSPA(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix32"))
-                settingsDB.setValue("Plugins/LADSPA_posix32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("LADSPA_posix32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix64:
                 plugins = self._checkLADSPA(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix64"))
-                settingsDB.setValue("Plugins/LADSPA_posix64", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("LADSPA_posix64", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin32:
                 plugins = self._checkLADSPA("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win32.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/LADSPA_win32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("LADSPA_win32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin64:
                 plugins = self._checkLADSPA("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win64.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/LADSPA_win64", plugins)
+                savePluginList("LADSPA_win64", plugins)
 
-            settingsDB.sync()
-            if not self.fContinueChecking: return
+            if self.fStopEvent.is_set(): return
 
             if haveLRDF and checkValue > 0:
                 startValue = self.fLastCheckValue - rdfPadValue
@@ -594,204 +941,160 @@ class SearchPluginsThread(QThread):
                     json.dump(ladspaRdfInfo, fdLadspa)
                     fdLadspa.close()
 
-                if not self.fContinueChecking: return
+                if self.fStopEvent.is_set(): return
 
         if self.fCheckDSSI:
             if self.fCheckNative:
                 plugins = self._checkDSSI(OS, self.fToolNative)
-                settingsDB.setValue("Plugins/DSSI_native", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("DSSI_native", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix32:
                 plugins = self._checkDSSI(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix32"))
-                settingsDB.setValue("Plugins/DSSI_posix32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("DSSI_posix32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix64:
                 plugins = self._checkDSSI(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix64"))
-                settingsDB.setValue("Plugins/DSSI_posix64", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("DSSI_posix64", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin32:
                 plugins = self._checkDSSI("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win32.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/DSSI_win32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("DSSI_win32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin64:
                 plugins = self._checkDSSI("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win64.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/DSSI_win64", plugins)
+                savePluginList("DSSI_win64", plugins)
 
-            settingsDB.sync()
-            if not self.fContinueChecking: return
+            if self.fStopEvent.is_set(): return
 
         if self.fCheckLV2:
-            plugins = self._checkCached(True)
-            settingsDB.setValue("Plugins/LV2", plugins)
-            settingsDB.sync()
-            if not self.fContinueChecking: return
+            plugins = self._checkCached(True, lv2Path)
+            savePluginList("LV2", plugins)
+            if self.fStopEvent.is_set(): return
 
         if self.fCheckVST2:
             if self.fCheckNative:
                 plugins = self._checkVST2(OS, self.fToolNative)
-                settingsDB.setValue("Plugins/VST2_native", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST2_native", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix32:
                 plugins = self._checkVST2(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix32"))
-                settingsDB.setValue("Plugins/VST2_posix32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST2_posix32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix64:
                 plugins = self._checkVST2(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix64"))
-                settingsDB.setValue("Plugins/VST2_posix64", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST2_posix64", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin32:
                 plugins = self._checkVST2("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win32.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/VST2_win32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST2_win32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin64:
                 plugins = self._checkVST2("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win64.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/VST2_win64", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST2_win64", plugins)
+                if self.fStopEvent.is_set(): return
 
-            settingsDB.sync()
-            if not self.fContinueChecking: return
+            if self.fStopEvent.is_set(): return
 
         if self.fCheckVST3:
             if self.fCheckNative and (MACOS or WINDOWS):
                 plugins = self._checkVST3(OS, self.fToolNative)
-                settingsDB.setValue("Plugins/VST3_native", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST3_native", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix32:
                 plugins = self._checkVST3(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix32"))
-                settingsDB.setValue("Plugins/VST3_posix32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST3_posix32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix64:
                 plugins = self._checkVST3(OS, os.path.join(self.fPathBinaries, "carla-discovery-posix64"))
-                settingsDB.setValue("Plugins/VST3_posix64", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST3_posix64", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin32:
                 plugins = self._checkVST3("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win32.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/VST3_win32", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST3_win32", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckWin64:
                 plugins = self._checkVST3("WINDOWS", os.path.join(self.fPathBinaries, "carla-discovery-win64.exe"), not WINDOWS)
-                settingsDB.setValue("Plugins/VST3_win64", plugins)
-                if not self.fContinueChecking: return
+                savePluginList("VST3_win64", plugins)
+                if self.fStopEvent.is_set(): return
 
-            settingsDB.sync()
-            if not self.fContinueChecking: return
+            if self.fStopEvent.is_set(): return
 
         if self.fCheckAU:
             if self.fCheckNative:
-                plugins = self._checkCached(False)
-                settingsDB.setValue("Plugins/AU", plugins)
-                settingsDB.sync()
-                if not self.fContinueChecking: return
+                plugins = self._checkCached(False, "")
+                savePluginList("AU", plugins)
+                if self.fStopEvent.is_set(): return
 
             if self.fCheckPosix32:
                 plugins = self._checkAU(os.path.join(self.fPathBinaries, "carla-discovery-posix32"))
-                settingsDB.setValue("Plugins/AU_posix32", self.fAuPlugins)
-                if not self.fContinueChecking: return
+                savePluginList("AU_posix32", self.fAuPlugins)
+                if self.fStopEvent.is_set(): return
 
-            settingsDB.sync()
-            if not self.fContinueChecking: return
+            if self.fStopEvent.is_set(): return
 
         if self.fCheckSF2:
-            settings = QSettings("falkTX", "Carla2")
-            SF2_PATH = toList(settings.value(CARLA_KEY_PATHS_SF2, CARLA_DEFAULT_SF2_PATH))
-            del settings
-
-            kits = self._checkKIT(SF2_PATH, "sf2")
-            settingsDB.setValue("Plugins/SF2", kits)
-            settingsDB.sync()
-            if not self.fContinueChecking: return
+            kits = self._checkKIT(self.fPathSF2, "sf2")
+            savePluginList("SF2", kits)
+            if self.fStopEvent.is_set(): return
 
         if self.fCheckSFZ:
-            kits = self._checkSfzCached()
-            settingsDB.setValue("Plugins/SFZ", kits)
-            settingsDB.sync()
+            kits = self._checkSfzCached(sfzPath)
+            savePluginList("SFZ", kits)
 
     def _checkLADSPA(self, OS, tool, isWine=False):
-        ladspaBinaries = []
+        ladspaBinaries = set()
         ladspaPlugins = []
 
         self._pluginLook(self.fLastCheckValue, "LADSPA plugins...")
 
-        settings = QSettings("falkTX", "Carla2")
-        LADSPA_PATH = toList(settings.value(CARLA_KEY_PATHS_LADSPA, CARLA_DEFAULT_LADSPA_PATH))
-        del settings
-
-        for iPATH in LADSPA_PATH:
+        for iPATH in self.fPathLADSPA:
             binaries = findBinaries(iPATH, PLUGIN_LADSPA, OS)
-            for binary in binaries:
-                if binary not in ladspaBinaries:
-                    ladspaBinaries.append(binary)
+            ladspaBinaries.update(binaries)
 
-        ladspaBinaries.sort()
+        ladspaBinaries = sorted(ladspaBinaries)
 
-        if not self.fContinueChecking:
+        if self.fStopEvent.is_set():
             return ladspaPlugins
 
-        for i in range(len(ladspaBinaries)):
-            ladspa  = ladspaBinaries[i]
-            percent = ( float(i) / len(ladspaBinaries) ) * self.fCurPercentValue
-            self._pluginLook((self.fLastCheckValue + percent) * 0.9, ladspa)
-
-            plugins = checkPluginLADSPA(ladspa, tool, self.fWineSettings if isWine else None)
-            if plugins:
-                ladspaPlugins.append(plugins)
-
-            if not self.fContinueChecking:
-                break
+        ladspaPlugins = self._checkBinaries(checkPluginLADSPA, ladspaBinaries, tool, isWine, 0.9)
 
         self.fLastCheckValue += self.fCurPercentValue
         return ladspaPlugins
 
     def _checkDSSI(self, OS, tool, isWine=False):
-        dssiBinaries = []
+        dssiBinaries = set()
         dssiPlugins = []
 
         self._pluginLook(self.fLastCheckValue, "DSSI plugins...")
 
-        settings = QSettings("falkTX", "Carla2")
-        DSSI_PATH = toList(settings.value(CARLA_KEY_PATHS_DSSI, CARLA_DEFAULT_DSSI_PATH))
-        del settings
-
-        for iPATH in DSSI_PATH:
+        for iPATH in self.fPathDSSI:
             binaries = findBinaries(iPATH, PLUGIN_DSSI, OS)
-            for binary in binaries:
-                if binary not in dssiBinaries:
-                    dssiBinaries.append(binary)
+            dssiBinaries.update(binaries)
 
-        dssiBinaries.sort()
+        dssiBinaries = sorted(dssiBinaries)
 
-        if not self.fContinueChecking:
+        if self.fStopEvent.is_set():
             return dssiPlugins
 
-        for i in range(len(dssiBinaries)):
-            dssi    = dssiBinaries[i]
-            percent = ( float(i) / len(dssiBinaries) ) * self.fCurPercentValue
-            self._pluginLook(self.fLastCheckValue + percent, dssi)
-
-            plugins = checkPluginDSSI(dssi, tool, self.fWineSettings if isWine else None)
-            if plugins:
-                dssiPlugins.append(plugins)
-
-            if not self.fContinueChecking:
-                break
+        dssiPlugins = self._checkBinaries(checkPluginDSSI, dssiBinaries, tool, isWine)
 
         self.fLastCheckValue += self.fCurPercentValue
         return dssiPlugins
 
     def _checkVST2(self, OS, tool, isWine=False):
-        vst2Binaries = []
+        vst2Binaries = set()
         vst2Plugins = []
 
         if MACOS and not isWine:
@@ -799,41 +1102,25 @@ class SearchPluginsThread(QThread):
         else:
             self._pluginLook(self.fLastCheckValue, "VST2 plugins...")
 
-        settings = QSettings("falkTX", "Carla2")
-        VST2_PATH = toList(settings.value(CARLA_KEY_PATHS_VST2, CARLA_DEFAULT_VST2_PATH))
-        del settings
-
-        for iPATH in VST2_PATH:
+        for iPATH in self.fPathVST2:
             if MACOS and not isWine:
                 binaries = findMacVSTBundles(iPATH, False)
             else:
                 binaries = findBinaries(iPATH, PLUGIN_VST2, OS)
-            for binary in binaries:
-                if binary not in vst2Binaries:
-                    vst2Binaries.append(binary)
+            vst2Binaries.update(binaries)
 
-        vst2Binaries.sort()
+        vst2Binaries = sorted(vst2Binaries)
 
-        if not self.fContinueChecking:
+        if self.fStopEvent.is_set():
             return vst2Plugins
 
-        for i in range(len(vst2Binaries)):
-            vst2    = vst2Binaries[i]
-            percent = ( float(i) / len(vst2Binaries) ) * self.fCurPercentValue
-            self._pluginLook(self.fLastCheckValue + percent, vst2)
-
-            plugins = checkPluginVST2(vst2, tool, self.fWineSettings if isWine else None)
-            if plugins:
-                vst2Plugins.append(plugins)
-
-            if not self.fContinueChecking:
-                break
+        vst2Plugins = self._checkBinaries(checkPluginVST2, vst2Binaries, tool, isWine)
 
         self.fLastCheckValue += self.fCurPercentValue
         return vst2Plugins
 
     def _checkVST3(self, OS, tool, isWine=False):
-        vst3Binaries = []
+        vst3Binaries = set()
         vst3Plugins = []
 
         if MACOS and not isWine:
@@ -841,39 +1128,85 @@ class SearchPluginsThread(QThread):
         else:
             self._pluginLook(self.fLastCheckValue, "VST2 plugins...")
 
-        settings = QSettings("falkTX", "Carla2")
-        VST3_PATH = toList(settings.value(CARLA_KEY_PATHS_VST3, CARLA_DEFAULT_VST3_PATH))
-        del settings
-
-        for iPATH in VST3_PATH:
+        for iPATH in self.fPathVST3:
             if MACOS and not isWine:
                 binaries = findMacVSTBundles(iPATH, True)
             else:
                 binaries = findVST3Binaries(iPATH)
-            for binary in binaries:
-                if binary not in vst3Binaries:
-                    vst3Binaries.append(binary)
+            vst3Binaries.update(binaries)
 
-        vst3Binaries.sort()
+        vst3Binaries = sorted(vst3Binaries)
 
-        if not self.fContinueChecking:
+        if self.fStopEvent.is_set():
             return vst3Plugins
 
-        for i in range(len(vst3Binaries)):
-            vst3    = vst3Binaries[i]
-            percent = ( float(i) / len(vst3Binaries) ) * self.fCurPercentValue
-            self._pluginLook(self.fLastCheckValue + percent, vst3)
-
-            plugins = checkPluginVST3(vst3, tool, self.fWineSettings if isWine else None)
-            if plugins:
-                vst3Plugins.append(plugins)
-
-            if not self.fContinueChecking:
-                break
+        vst3Plugins = self._checkBinaries(checkPluginVST3, vst3Binaries, tool, isWine)
 
         self.fLastCheckValue += self.fCurPercentValue
         return vst3Plugins
 
+    def _checkBinaries(self, checkFunc, binaries, tool, isWine, percentScale=1.0):
+        wineSettings = self.fWineSettings if isWine else None
+        results = {}
+
+        # these do not change during the loop
+        curPercentValue = self.fCurPercentValue
+        lastCheckValue  = self.fLastCheckValue
+        pluginLook      = self._pluginFileLook
+        percentStep     = curPercentValue / max(1, len(binaries))
+        percent         = 0.0
+
+        runningBinaries     = self.fRunningBinaries
+        runningBinariesLock = self.fRunningBinariesLock
+
+        def check(binary):
+            # do not start new checks after the user closed the dialog
+            if self.fStopEvent.is_set():
+                return None
+
+            with runningBinariesLock:
+                runningBinaries[binary] = monotonic()
+
+            try:
+                return checkFunc(binary, tool, wineSettings)
+            finally:
+                with runningBinariesLock:
+                    del runningBinaries[binary]
+
+        # each check runs in its own carla-discovery process, so we can run several of them at once
+        with ThreadPoolExecutor(max_workers=self.fMaxParallel) as executor:
+            futures = dict((executor.submit(check, binary), binary) for binary in binaries)
+            pending = set(futures)
+            lookBinary = ""
+
+            while pending:
+                # wake up regularly even if nothing finished, so a stuck check still shows up
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    binary = futures[future]
+                    lookBinary = binary
+                    percent += percentStep
+
+                    plugins = future.result()
+                    if plugins:
+                        results[binary] = plugins
+
+                # show the check that has been running the longest, that is the one skip would stop
+                with runningBinariesLock:
+                    if runningBinaries:
+                        lookBinary = min(runningBinaries, key=runningBinaries.get)
+
+                pluginLook((lastCheckValue + percent) * percentScale, lookBinary)
+
+                if self.fStopEvent.is_set():
+                    for future in pending:
+                        future.cancel()
+                    break
+
+        # keep the same order as the binaries list
+        return [results[binary] for binary in binaries if binary in results]
+
     def _checkAU(self, tool):
         auPlugins = []
 
@@ -885,48 +1218,30 @@ class SearchPluginsThread(QThread):
         return auPlugins
 
     def _checkKIT(self, kitPATH, kitExtension):
-        kitFiles = []
+        kitFiles = set()
         kitPlugins = []
 
         for iPATH in kitPATH:
             files = findFilenames(iPATH, kitExtension)
-            for file_ in files:
-                if file_ not in kitFiles:
-                    kitFiles.append(file_)
+            kitFiles.update(files)
 
-        kitFiles.sort()
+        kitFiles = sorted(kitFiles)
 
-        if not self.fContinueChecking:
+        if self.fStopEvent.is_set():
             return kitPlugins
 
-        for i in range(len(kitFiles)):
-            kit     = kitFiles[i]
-            percent = ( float(i) / len(kitFiles) ) * self.fCurPercentValue
-            self._pluginLook(self.fLastCheckValue + percent, kit)
-
-            if kitExtension == "sf2":
-                plugins = checkFileSF2(kit, self.fToolNative)
-            else:
-                plugins = None
-
-            if plugins:
-                kitPlugins.append(plugins)
-
-            if not self.fContinueChecking:
-                break
+        if kitExtension == "sf2":
+            kitPlugins = self._checkBinaries(lambda kit, tool, wineSettings: checkFileSF2(kit, tool),
+                                             kitFiles, self.fToolNative, False)
 
         self.fLastCheckValue += self.fCurPercentValue
         return kitPlugins
 
-    def _checkCached(self, isLV2):
+    def _checkCached(self, isLV2, PLUG_PATH):
         if isLV2:
-            settings  = QSettings("falkTX", "Carla2")
-            PLUG_PATH = splitter.join(toList(settings.value(CARLA_KEY_PATHS_LV2, CARLA_DEFAULT_LV2_PATH)))
-            del settings
             PLUG_TEXT = "LV2"
             PLUG_TYPE = PLUGIN_LV2
         else: # AU
-            PLUG_PATH = ""
             PLUG_TEXT = "AU"
             PLUG_TYPE = PLUGIN_AU
 
@@ -935,63 +1250,77 @@ class SearchPluginsThread(QThread):
 
         count = gCarla.utils.get_cached_plugin_count(PLUG_TYPE, PLUG_PATH)
 
-        if not self.fContinueChecking:
+        if self.fStopEvent.is_set():
             return plugins
 
-        for i in range(count):
-            descInfo = gCarla.utils.get_cached_plugin_info(PLUG_TYPE, i)
+        getCachedPluginInfo = gCarla.utils.get_cached_plugin_info
+        percentStep = self.fCurPercentValue / max(1, count)
 
-            percent = ( float(i) / count ) * self.fCurPercentValue
-            self._pluginLook(self.fLastCheckValue + percent, descInfo['label'])
+        for i in range(count):
+            descInfo = getCachedPluginInfo(PLUG_TYPE, i)
+            self._pluginFileLook(self.fLastCheckValue + i * percentStep, descInfo['label'])
 
             if not descInfo['valid']:
                 continue
 
             plugins.append(checkPluginCached(descInfo, PLUG_TYPE))
 
-            if not self.fContinueChecking:
+            if self.fStopEvent.is_set():
                 break
 
         self.fLastCheckValue += self.fCurPercentValue
         return plugins
 
-    def _checkSfzCached(self):
-        settings  = QSettings("falkTX", "Carla2")
-        PLUG_PATH = splitter.join(toList(settings.value(CARLA_KEY_PATHS_SFZ, CARLA_DEFAULT_SFZ_PATH)))
-        del settings
-
+    def _checkSfzCached(self, PLUG_PATH):
         sfzKits = []
         self._pluginLook(self.fLastCheckValue, "SFZ kits...")
 
         count = gCarla.utils.get_cached_plugin_count(PLUGIN_SFZ, PLUG_PATH)
 
-        if not self.fContinueChecking:
+        if self.fStopEvent.is_set():
             return sfzKits
 
-        for i in range(count):
-            descInfo = gCarla.utils.get_cached_plugin_info(PLUGIN_SFZ, i)
+        getCachedPluginInfo = gCarla.utils.get_cached_plugin_info
+        percentStep = self.fCurPercentValue / max(1, count)
 
-            percent = ( float(i) / count ) * self.fCurPercentValue
-            self._pluginLook(self.fLastCheckValue + percent, descInfo['label'])
+        for i in range(count):
+            descInfo = getCachedPluginInfo(PLUGIN_SFZ, i)
+            self._pluginFileLook(self.fLastCheckValue + i * percentStep, descInfo['label'])
 
             if not descInfo['valid']:
                 continue
 
             sfzKits.append(checkPluginCached(descInfo, PLUGIN_SFZ))
 
-            if not self.fContinueChecking:
+            if self.fStopEvent.is_set():
                 break
 
         self.fLastCheckValue += self.fCurPercentValue
         return sfzKits
 
     def _pluginLook(self, percent, plugin):
+        if int(percent) == self.fLastLookPercent and plugin == self.fLastLookText:
+            return
+
+        self.fLastLookPercent = int(percent)
+        self.fLastLookText    = plugin
+        self.fLastLookTime    = monotonic()
         self.pluginLook.emit(percent, plugin)
 
+    # used per file, only updates the GUI when the progress changes or some time has passed
+    def _pluginFileLook(self, percent, plugin):
+        if int(percent) == self.fLastLookPercent and monotonic() - self.fLastLookTime < 0.05:
+            return
+        self._pluginLook(percent, plugin)
+
 # ---------------------------------------------------------------------------------------------------------------------
 # Plugin Refresh Dialog
 
 class PluginRefreshW(QDialog):
+    # shared by all refresh dialogs, loaded on first use
+    ICON_YES = None
+    ICON_NO  = None
+
     def __init__(self, parent, host):
         QDialog.__init__(self, parent)
         self.host = host
@@ -1011,13 +1340,44 @@ class PluginRefreshW(QDialog):
         hasWin32   = os.path.exists(os.path.join(self.host.pathBinaries, "carla-discovery-win32.exe"))
         hasWin64   = os.path.exists(os.path.join(self.host.pathBinaries, "carla-discovery-win64.exe"))
 
-        self.fThread  = SearchPluginsThread(self, host.pathBinaries)
-        self.fIconYes = QPixmap(":/16x16/dialog-ok-apply.svgz")
-        self.fIconNo  = QPixmap(":/16x16/dialog-error.svgz")
+        self.fThread = SearchPluginsThread(self, host.pathBinaries)
+
+        if PluginRefreshW.ICON_YES is None:
+            PluginRefreshW.ICON_YES = QPixmap(":/16x16/dialog-ok-apply.svgz")
+            PluginRefreshW.ICON_NO  = QPixmap(":/16x16/dialog-error.svgz")
+
+        self.fIconYes = PluginRefreshW.ICON_YES
+        self.fIconNo  = PluginRefreshW.ICON_NO
+
+        # same order as the SearchPluginsThread setters
+        self.fBinaryChecks = (self.ui.ch_native, self.ui.ch_posix32, self.ui.ch_posix64,
+                              self.ui.ch_win32, self.ui.ch_win64)
+        self.fTypeChecks   = (self.ui.ch_ladspa, self.ui.ch_dssi, self.ui.ch_lv2, self.ui.ch_vst,
+                              self.ui.ch_vst3, self.ui.ch_au, self.ui.ch_sf2, self.ui.ch_sfz)
+
+        # settings key, checkbox and default value
+        self.fSearchSettings = (
+            ("PluginDatabase/SearchLADSPA", self.ui.ch_ladspa, True),
+            ("PluginDatabase/SearchDSSI", self.ui.ch_dssi, True),
+            ("PluginDatabase/SearchLV2", self.ui.ch_lv2, True),
+            ("PluginDatabase/SearchVST2", self.ui.ch_vst, True),
+            ("PluginDatabase/SearchVST3", self.ui.ch_vst3, True),
+            ("PluginDatabase/SearchAU", self.ui.ch_au, True),
+            ("PluginDatabase/SearchSF2", self.ui.ch_sf2, False),
+            ("PluginDatabase/SearchSFZ", self.ui.ch_sfz, False),
+            ("PluginDatabase/SearchNative", self.ui.ch_native, True),
+            ("PluginDatabase/SearchPOSIX32", self.ui.ch_posix32, False),
+            ("PluginDatabase/SearchPOSIX64", self.ui.ch_posix64, False),
+            ("PluginDatabase/SearchWin32", self.ui.ch_win32, False),
+            ("PluginDatabase/SearchWin64", self.ui.ch_win64, False),
+        )
 
         # -------------------------------------------------------------------------------------------------------------
         # Set-up GUI
 
+        # lots of widgets get hidden or disabled below, only do a single layout and repaint at the end
+        self.setUpdatesEnabled(False)
+
         self.ui.b_skip.setVisible(False)
 
         if HAIKU:
@@ -1184,6 +1544,7 @@ class PluginRefreshW(QDialog):
         # Resize to minimum size, as it's very likely UI stuff was hidden
 
         self.resize(self.minimumSize())
+        self.setUpdatesEnabled(True)
 
         # -------------------------------------------------------------------------------------------------------------
         # Set-up connections
@@ -1191,19 +1552,8 @@ class PluginRefreshW(QDialog):
         self.finished.connect(self.slot_saveSettings)
         self.ui.b_start.clicked.connect(self.slot_start)
         self.ui.b_skip.clicked.connect(self.slot_skip)
-        self.ui.ch_native.clicked.connect(self.slot_checkTools)
-        self.ui.ch_posix32.clicked.connect(self.slot_checkTools)
-        self.ui.ch_posix64.clicked.connect(self.slot_checkTools)
-        self.ui.ch_win32.clicked.connect(self.slot_checkTools)
-        self.ui.ch_win64.clicked.connect(self.slot_checkTools)
-        self.ui.ch_ladspa.clicked.connect(self.slot_checkTools)
-        self.ui.ch_dssi.clicked.connect(self.slot_checkTools)
-        self.ui.ch_lv2.clicked.connect(self.slot_checkTools)
-        self.ui.ch_vst.clicked.connect(self.slot_checkTools)
-        self.ui.ch_vst3.clicked.connect(self.slot_checkTools)
-        self.ui.ch_au.clicked.connect(self.slot_checkTools)
-        self.ui.ch_sf2.clicked.connect(self.slot_checkTools)
-        self.ui.ch_sfz.clicked.connect(self.slot_checkTools)
+        for check in self.fBinaryChecks + self.fTypeChecks:
+            check.clicked.connect(self.slot_checkTools)
         self.fThread.pluginLook.connect(self.slot_handlePluginLook)
         self.fThread.finished.connect(self.slot_handlePluginThreadFinished)
 
@@ -1217,68 +1567,23 @@ class PluginRefreshW(QDialog):
     def loadSettings(self):
         settings = QSettings("falkTX", "CarlaRefresh2")
 
-        check = settings.value("PluginDatabase/SearchLADSPA", True, type=bool) and self.ui.ch_ladspa.isEnabled()
-        self.ui.ch_ladspa.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchDSSI", True, type=bool) and self.ui.ch_dssi.isEnabled()
-        self.ui.ch_dssi.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchLV2", True, type=bool) and self.ui.ch_lv2.isEnabled()
-        self.ui.ch_lv2.setChecked(check)
+        for key, check, default in self.fSearchSettings:
+            check.setChecked(getSettingsBool(settings, key, default) and check.isEnabled())
 
-        check = settings.value("PluginDatabase/SearchVST2", True, type=bool) and self.ui.ch_vst.isEnabled()
-        self.ui.ch_vst.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchVST3", True, type=bool) and self.ui.ch_vst3.isEnabled()
-        self.ui.ch_vst3.setChecked(check)
-
-        if MACOS:
-            check = settings.value("PluginDatabase/SearchAU", True, type=bool) and self.ui.ch_au.isEnabled()
-        else:
-            check = False
-        self.ui.ch_au.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchSF2", False, type=bool) and self.ui.ch_sf2.isEnabled()
-        self.ui.ch_sf2.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchSFZ", False, type=bool) and self.ui.ch_sfz.isEnabled()
-        self.ui.ch_sfz.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchNative", True, type=bool) and self.ui.ch_native.isEnabled()
-        self.ui.ch_native.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchPOSIX32", False, type=bool) and self.ui.ch_posix32.isEnabled()
-        self.ui.ch_posix32.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchPOSIX64", False, type=bool) and self.ui.ch_posix64.isEnabled()
-        self.ui.ch_posix64.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchWin32", False, type=bool) and self.ui.ch_win32.isEnabled()
-        self.ui.ch_win32.setChecked(check)
-
-        check = settings.value("PluginDatabase/SearchWin64", False, type=bool) and self.ui.ch_win64.isEnabled()
-        self.ui.ch_win64.setChecked(check)
+        if not MACOS:
+            self.ui.ch_au.setChecked(False)
 
-        self.ui.ch_do_checks.setChecked(settings.value("PluginDatabase/DoChecks", False, type=bool))
+        self.ui.ch_do_checks.setChecked(getSettingsBool(settings, "PluginDatabase/DoChecks", False))
 
     # -----------------------------------------------------------------------------------------------------------------
 
     @pyqtSlot()
     def slot_saveSettings(self):
         settings = QSettings("falkTX", "CarlaRefresh2")
-        settings.setValue("PluginDatabase/SearchLADSPA", self.ui.ch_ladspa.isChecked())
-        settings.setValue("PluginDatabase/SearchDSSI", self.ui.ch_dssi.isChecked())
-        settings.setValue("PluginDatabase/SearchLV2", self.ui.ch_lv2.isChecked())
-        settings.setValue("PluginDatabase/SearchVST2", self.ui.ch_vst.isChecked())
-        settings.setValue("PluginDatabase/SearchVST3", self.ui.ch_vst3.isChecked())
-        settings.setValue("PluginDatabase/SearchAU", self.ui.ch_au.isChecked())
-        settings.setValue("PluginDatabase/SearchSF2", self.ui.ch_sf2.isChecked())
-        settings.setValue("PluginDatabase/SearchSFZ", self.ui.ch_sfz.isChecked())
-        settings.setValue("PluginDatabase/SearchNative", self.ui.ch_native.isChecked())
-        settings.setValue("PluginDatabase/SearchPOSIX32", self.ui.ch_posix32.isChecked())
-        settings.setValue("PluginDatabase/SearchPOSIX64", self.ui.ch_posix64.isChecked())
-        settings.setValue("PluginDatabase/SearchWin32", self.ui.ch_win32.isChecked())
-        settings.setValue("PluginDatabase/SearchWin64", self.ui.ch_win64.isChecked())
+
+        for key, check, default in self.fSearchSettings:
+            settings.setValue(key, check.isChecked())
+
         settings.setValue("PluginDatabase/DoChecks", self.ui.ch_do_checks.isChecked())
 
     # -----------------------------------------------------------------------------------------------------------------
@@ -1299,37 +1604,22 @@ class PluginRefreshW(QDialog):
         else:
             gCarla.utils.setenv("CARLA_DISCOVERY_NO_PROCESSING_CHECKS", "true")
 
-        native, posix32, posix64, win32, win64 = (self.ui.ch_native.isChecked(),
-                                                  self.ui.ch_posix32.isChecked(), self.ui.ch_posix64.isChecked(),
-                                                  self.ui.ch_win32.isChecked(), self.ui.ch_win64.isChecked())
-
-        ladspa, dssi, lv2, vst, vst3, au, sf2, sfz = (self.ui.ch_ladspa.isChecked(), self.ui.ch_dssi.isChecked(),
-                                                      self.ui.ch_lv2.isChecked(), self.ui.ch_vst.isChecked(),
-                                                      self.ui.ch_vst3.isChecked(), self.ui.ch_au.isChecked(),
-                                                      self.ui.ch_sf2.isChecked(), self.ui.ch_sfz.isChecked())
-
-        self.fThread.setSearchBinaryTypes(native, posix32, posix64, win32, win64)
-        self.fThread.setSearchPluginTypes(ladspa, dssi, lv2, vst, vst3, au, sf2, sfz)
+        self.fThread.setSearchBinaryTypes(*(check.isChecked() for check in self.fBinaryChecks))
+        self.fThread.setSearchPluginTypes(*(check.isChecked() for check in self.fTypeChecks))
         self.fThread.start()
 
     # -----------------------------------------------------------------------------------------------------------------
 
     @pyqtSlot()
     def slot_skip(self):
-        killDiscovery()
+        killOldestDiscovery()
 
     # -----------------------------------------------------------------------------------------------------------------
 
     @pyqtSlot()
     def slot_checkTools(self):
-        enabled1 = bool(self.ui.ch_native.isChecked() or
-                        self.ui.ch_posix32.isChecked() or self.ui.ch_posix64.isChecked() or
-                        self.ui.ch_win32.isChecked() or self.ui.ch_win64.isChecked())
-
-        enabled2 = bool(self.ui.ch_ladspa.isChecked() or self.ui.ch_dssi.isChecked() or
-                        self.ui.ch_lv2.isChecked() or self.ui.ch_vst.isChecked() or
-                        self.ui.ch_vst3.isChecked() or self.ui.ch_au.isChecked() or
-                        self.ui.ch_sf2.isChecked() or self.ui.ch_sfz.isChecked())
+        enabled1 = any(check.isChecked() for check in self.fBinaryChecks)
+        enabled2 = any(check.isChecked() for check in self.fTypeChecks)
 
         self.ui.b_start.setEnabled(enabled1 and enabled2)
 
@@ -1379,6 +1669,66 @@ class PluginRefreshW(QDialog):
 # ---------------------------------------------------------------------------------------------------------------------
 # Plugin Database Dialog
 
+# non-native binary types, run through bridges or wine
+if HAIKU or LINUX or MACOS:
+    kBridgedNativeBinaries = frozenset((BINARY_POSIX32, BINARY_POSIX64))
+    kBridgedWineBinaries   = frozenset((BINARY_WIN32, BINARY_WIN64))
+elif WINDOWS:
+    kBridgedNativeBinaries = frozenset((BINARY_WIN32, BINARY_WIN64))
+    kBridgedWineBinaries   = frozenset()
+else:
+    kBridgedNativeBinaries = frozenset()
+    kBridgedWineBinaries   = frozenset()
+
+# show or hide each table row, kept outside the dialog class so everything used in the loop is a local
+def filterPluginRows(tableWidget, rowCount, pluginRows, nameColumn,
+                     hideMask, requireMask, tokens, hideNonFavs, favoriteKeys, narrowing):
+    item         = tableWidget.item
+    isRowHidden  = tableWidget.isRowHidden
+    setRowHidden = tableWidget.setRowHidden
+    indexRole    = Qt.UserRole+1
+
+    # a single word is checked directly
+    needle = tokens[0] if len(tokens) == 1 else None
+
+    for i in range(rowCount):
+        if narrowing and isRowHidden(i):
+            continue
+
+        pluginRow = pluginRows[item(i, nameColumn).data(indexRole)]
+        ptext = pluginRow['text']
+        flags = pluginRow['flags']
+
+        if flags & hideMask:
+            hidden = True
+        elif (flags & requireMask) != requireMask:
+            hidden = True
+        elif needle is not None and needle not in ptext:
+            hidden = True
+        elif needle is None and tokens and not all(t in ptext for t in tokens):
+            hidden = True
+        elif hideNonFavs and pluginRow['favKey'] not in favoriteKeys:
+            hidden = True
+        else:
+            hidden = False
+
+        # only touch rows that actually change
+        if hidden != isRowHidden(i):
+            setRowHidden(i, hidden)
+
+# many plugins share a binary, and the table is refilled with the same files on every refresh
+@lru_cache(maxsize=4096)
+def getPluginBaseName(filename):
+    return os.path.basename(filename)
+
+# architecture names shown in the plugin info tab
+kBinaryArchNames = {
+    BINARY_POSIX32: "posix32",
+    BINARY_POSIX64: "posix64",
+    BINARY_WIN32:   "win32",
+    BINARY_WIN64:   "win64",
+}
+
 class PluginDatabaseW(QDialog):
     TABLEWIDGET_ITEM_FAVORITE = 0
     TABLEWIDGET_ITEM_NAME     = 1
@@ -1386,6 +1736,28 @@ class PluginDatabaseW(QDialog):
     TABLEWIDGET_ITEM_MAKER    = 3
     TABLEWIDGET_ITEM_BINARY   = 4
 
+    # plugin properties used for filtering, worked out once per table row
+    FILTER_EFFECT         = 1 << 0
+    FILTER_INSTRUMENT     = 1 << 1
+    FILTER_MIDI           = 1 << 2
+    FILTER_KIT            = 1 << 3
+    FILTER_OTHER          = 1 << 4
+    FILTER_INTERNAL       = 1 << 5
+    FILTER_LADSPA         = 1 << 6
+    FILTER_DSSI           = 1 << 7
+    FILTER_LV2            = 1 << 8
+    FILTER_VST2           = 1 << 9
+    FILTER_VST3           = 1 << 10
+    FILTER_AU             = 1 << 11
+    FILTER_NATIVE         = 1 << 12
+    FILTER_BRIDGED        = 1 << 13
+    FILTER_BRIDGED_WINE   = 1 << 14
+    FILTER_RTSAFE         = 1 << 15
+    FILTER_CV             = 1 << 16
+    FILTER_GUI            = 1 << 17
+    FILTER_INLINE_DISPLAY = 1 << 18
+    FILTER_STEREO         = 1 << 19
+
     def __init__(self, parent, host):
         QDialog.__init__(self, parent)
         self.host = host
@@ -1401,15 +1773,75 @@ class PluginDatabaseW(QDialog):
         # Internal stuff
 
         self.fLastTableIndex = 0
+        self.fPluginRows = []
         self.fRetPlugin  = None
         self.fRealParent = parent
         self.fFavoritePlugins = []
+        self.fFavoritePluginKeys = set()
         self.fFavoritePluginsChanged = False
+        self.fSettingsCache = {}
+        self.fSortIndicatorShown = True
+        self.fBulkAdding = False
+        self.fLastFilterState = None
+        self.fLastFilterText  = ""
 
         self.fTrYes    = self.tr("Yes")
         self.fTrNo     = self.tr("No")
         self.fTrNative = self.tr("Native")
 
+        # filter once the user stops typing, instead of on every key press
+        self.fFilterTimer = QTimer(self)
+        self.fFilterTimer.setSingleShot(True)
+        self.fFilterTimer.setInterval(100)
+
+        # settings key, checkbox and default value for each of the filter options
+        self.fShowSettings = (
+            ("ShowEffects", self.ui.ch_effects, True),
+            ("ShowInstruments", self.ui.ch_instruments, True),
+            ("ShowMIDI", self.ui.ch_midi, True),
+            ("ShowOther", self.ui.ch_other, True),
+            ("ShowInternal", self.ui.ch_internal, True),
+            ("ShowLADSPA", self.ui.ch_ladspa, True),
+            ("ShowDSSI", self.ui.ch_dssi, True),
+            ("ShowLV2", self.ui.ch_lv2, True),
+            ("ShowVST2", self.ui.ch_vst, True),
+            ("ShowVST3", self.ui.ch_vst3, (MACOS or WINDOWS)),
+            ("ShowAU", self.ui.ch_au, MACOS),
+            ("ShowKits", self.ui.ch_kits, True),
+            ("ShowNative", self.ui.ch_native, True),
+            ("ShowBridged", self.ui.ch_bridged, True),
+            ("ShowBridgedWine", self.ui.ch_bridged_wine, True),
+            ("ShowFavorites", self.ui.ch_favorites, False),
+            ("ShowRtSafe", self.ui.ch_rtsafe, False),
+            ("ShowHasCV", self.ui.ch_cv, False),
+            ("ShowHasGUI", self.ui.ch_gui, False),
+            ("ShowHasInlineDisplay", self.ui.ch_inline_display, False),
+            ("ShowStereoOnly", self.ui.ch_stereo, False),
+        )
+
+        # checkbox states set by the "clear filters" button, VST3 and AU are handled separately
+        self.fClearFilterStates = (
+            (self.ui.ch_internal, True),
+            (self.ui.ch_ladspa, True),
+            (self.ui.ch_dssi, True),
+            (self.ui.ch_lv2, True),
+            (self.ui.ch_vst, True),
+            (self.ui.ch_kits, True),
+            (self.ui.ch_instruments, True),
+            (self.ui.ch_effects, True),
+            (self.ui.ch_midi, True),
+            (self.ui.ch_other, True),
+            (self.ui.ch_native, True),
+            (self.ui.ch_bridged, False),
+            (self.ui.ch_bridged_wine, False),
+            (self.ui.ch_favorites, False),
+            (self.ui.ch_rtsafe, False),
+            (self.ui.ch_stereo, False),
+            (self.ui.ch_cv, False),
+            (self.ui.ch_gui, False),
+            (self.ui.ch_inline_display, False),
+        )
+
         # ----------------------------------------------------------------------------------------------------
         # Set-up GUI
 
@@ -1470,7 +1902,8 @@ class PluginDatabaseW(QDialog):
         self.ui.b_cancel.clicked.connect(self.reject)
         self.ui.b_refresh.clicked.connect(self.slot_refreshPlugins)
         self.ui.b_clear_filters.clicked.connect(self.slot_clearFilters)
-        self.ui.lineEdit.textChanged.connect(self.slot_checkFilters)
+        self.ui.lineEdit.textChanged.connect(self.slot_checkFiltersDelayed)
+        self.fFilterTimer.timeout.connect(self.slot_checkFilters)
         self.ui.tableWidget.currentCellChanged.connect(self.slot_checkPlugin)
         self.ui.tableWidget.cellClicked.connect(self.slot_cellClicked)
         self.ui.tableWidget.cellDoubleClicked.connect(self.slot_cellDoubleClicked)
@@ -1500,7 +1933,8 @@ class PluginDatabaseW(QDialog):
         # ----------------------------------------------------------------------------------------------------
         # Post-connect setup
 
-        self._reAddPlugins()
+        # fill the table once the event loop runs, so the dialog shows up without waiting for the plugin lists
+        QTimer.singleShot(0, self._reAddPlugins)
         self.ui.lineEdit.setFocus()
 
     # --------------------------------------------------------------------------------------------------------
@@ -1508,20 +1942,23 @@ class PluginDatabaseW(QDialog):
     @pyqtSlot(int, int)
     def slot_cellClicked(self, row, column):
         if column == self.TABLEWIDGET_ITEM_FAVORITE:
-            widget = self.ui.tableWidget.item(row, self.TABLEWIDGET_ITEM_FAVORITE)
-            plugin = self.ui.tableWidget.item(row, self.TABLEWIDGET_ITEM_NAME).data(Qt.UserRole+1)
-            plugin = self._createFavoritePluginDict(plugin)
+            tableWidget = self.ui.tableWidget
+            widget = tableWidget.item(row, self.TABLEWIDGET_ITEM_FAVORITE)
+            pluginRow = self._getPluginRow(row)
+            plugin    = pluginRow['plugin']
+            key       = pluginRow['favKey']
 
             if widget.checkState() == Qt.Checked:
-                if not plugin in self.fFavoritePlugins:
-                    self.fFavoritePlugins.append(plugin)
-                    self.fFavoritePluginsChanged = True
-            else:
-                try:
-                    self.fFavoritePlugins.remove(plugin)
+                if key not in self.fFavoritePluginKeys:
+                    self.fFavoritePluginKeys.add(key)
+                    self.fFavoritePlugins.append(self._createFavoritePluginDict(plugin))
                     self.fFavoritePluginsChanged = True
-                except ValueError:
-                    pass
+                    self.fLastFilterState = None
+            elif key in self.fFavoritePluginKeys:
+                self.fFavoritePluginKeys.discard(key)
+                self.fFavoritePlugins = [fav for fav in self.fFavoritePlugins if self._getFavoritePluginKey(fav) != key]
+                self.fFavoritePluginsChanged = True
+                self.fLastFilterState = None
 
     @pyqtSlot(int, int)
     def slot_cellDoubleClicked(self, row, column):
@@ -1530,9 +1967,11 @@ class PluginDatabaseW(QDialog):
 
     @pyqtSlot()
     def slot_addPlugin(self):
-        if self.ui.tableWidget.currentRow() >= 0:
-            self.fRetPlugin = self.ui.tableWidget.item(self.ui.tableWidget.currentRow(),
-                                                       self.TABLEWIDGET_ITEM_NAME).data(Qt.UserRole+1)
+        tableWidget = self.ui.tableWidget
+        row = tableWidget.currentRow()
+
+        if row >= 0:
+            self.fRetPlugin = self._getPluginRow(row)['plugin']
             self.accept()
         else:
             self.reject()
@@ -1541,38 +1980,22 @@ class PluginDatabaseW(QDialog):
     def slot_checkPlugin(self, row):
         if row >= 0:
             self.ui.b_add.setEnabled(True)
-            plugin = self.ui.tableWidget.item(self.ui.tableWidget.currentRow(),
-                                              self.TABLEWIDGET_ITEM_NAME).data(Qt.UserRole+1)
-
-            isSynth  = bool(plugin['hints'] & PLUGIN_IS_SYNTH)
-            isEffect = bool(plugin['audio.ins'] > 0 < plugin['audio.outs'] and not isSynth)
-            isMidi   = bool(plugin['audio.ins'] == 0 and plugin['audio.outs'] == 0 and plugin['midi.ins'] > 0 < plugin['midi.outs'])
-            isKit    = bool(plugin['type'] in (PLUGIN_SF2, PLUGIN_SFZ))
-            isOther  = bool(not (isEffect or isSynth or isMidi or isKit))
-
-            if isSynth:
-                ptype = "Instrument"
-            elif isEffect:
-                ptype = "Effect"
-            elif isMidi:
-                ptype = "MIDI Plugin"
-            else:
-                ptype = "Other"
+            # row is always the current one, as given by currentCellChanged or _reAddPlugins
+            pluginRow = self._getPluginRow(row)
+            plugin    = pluginRow['plugin']
+
+            # computed when the plugin was added to the table
+            ptype   = pluginRow['kind']
+            isSynth = ptype == "Instrument"
+
+            build = plugin['build']
 
-            if plugin['build'] == BINARY_NATIVE:
+            if build == BINARY_NATIVE:
                 parch = self.fTrNative
-            elif plugin['build'] == BINARY_POSIX32:
-                parch = "posix32"
-            elif plugin['build'] == BINARY_POSIX64:
-                parch = "posix64"
-            elif plugin['build'] == BINARY_WIN32:
-                parch = "win32"
-            elif plugin['build'] == BINARY_WIN64:
-                parch = "win64"
-            elif plugin['build'] == BINARY_OTHER:
+            elif build == BINARY_OTHER:
                 parch = self.tr("Other")
-            elif plugin['build'] == BINARY_WIN32:
-                parch = self.tr("Unknown")
+            else:
+                parch = kBinaryArchNames.get(build, self.tr("Unknown"))
 
             self.ui.l_format.setText(getPluginTypeAsString(plugin['type']))
             self.ui.l_type.setText(ptype)
@@ -1613,6 +2036,10 @@ class PluginDatabaseW(QDialog):
     def slot_checkFilters(self):
         self._checkFilters()
 
+    @pyqtSlot()
+    def slot_checkFiltersDelayed(self):
+        self.fFilterTimer.start()
+
     @pyqtSlot()
     def slot_refreshPlugins(self):
         if PluginRefreshW(self, self.host).exec_():
@@ -1623,30 +2050,12 @@ class PluginDatabaseW(QDialog):
 
     @pyqtSlot()
     def slot_clearFilters(self):
+        # the table is filtered once below, only redraw everything after that
+        self.setUpdatesEnabled(False)
         self.blockSignals(True)
 
-        self.ui.ch_internal.setChecked(True)
-        self.ui.ch_ladspa.setChecked(True)
-        self.ui.ch_dssi.setChecked(True)
-        self.ui.ch_lv2.setChecked(True)
-        self.ui.ch_vst.setChecked(True)
-        self.ui.ch_kits.setChecked(True)
-
-        self.ui.ch_instruments.setChecked(True)
-        self.ui.ch_effects.setChecked(True)
-        self.ui.ch_midi.setChecked(True)
-        self.ui.ch_other.setChecked(True)
-
-        self.ui.ch_native.setChecked(True)
-        self.ui.ch_bridged.setChecked(False)
-        self.ui.ch_bridged_wine.setChecked(False)
-
-        self.ui.ch_favorites.setChecked(False)
-        self.ui.ch_rtsafe.setChecked(False)
-        self.ui.ch_stereo.setChecked(False)
-        self.ui.ch_cv.setChecked(False)
-        self.ui.ch_gui.setChecked(False)
-        self.ui.ch_inline_display.setChecked(False)
+        for check, checked in self.fClearFilterStates:
+            check.setChecked(checked)
 
         if self.ui.ch_vst3.isEnabled():
             self.ui.ch_vst3.setChecked(True)
@@ -1658,72 +2067,59 @@ class PluginDatabaseW(QDialog):
         self.blockSignals(False)
 
         self._checkFilters()
+        self.setUpdatesEnabled(True)
 
     # --------------------------------------------------------------------------------------------------------
 
     @pyqtSlot()
     def slot_saveSettings(self):
+        values = {
+            "Geometry": self.saveGeometry(),
+            "TableGeometry_6": self.ui.tableWidget.horizontalHeader().saveState(),
+            "SearchText": self.ui.lineEdit.text(),
+        }
+        values.update((key, check.isChecked()) for key, check, default in self.fShowSettings)
+
         settings = QSettings("falkTX", "CarlaDatabase2")
-        settings.setValue("PluginDatabase/Geometry", self.saveGeometry())
-        settings.setValue("PluginDatabase/TableGeometry_6", self.ui.tableWidget.horizontalHeader().saveState())
-        settings.setValue("PluginDatabase/ShowEffects", self.ui.ch_effects.isChecked())
-        settings.setValue("PluginDatabase/ShowInstruments", self.ui.ch_instruments.isChecked())
-        settings.setValue("PluginDatabase/ShowMIDI", self.ui.ch_midi.isChecked())
-        settings.setValue("PluginDatabase/ShowOther", self.ui.ch_other.isChecked())
-        settings.setValue("PluginDatabase/ShowInternal", self.ui.ch_internal.isChecked())
-        settings.setValue("PluginDatabase/ShowLADSPA", self.ui.ch_ladspa.isChecked())
-        settings.setValue("PluginDatabase/ShowDSSI", self.ui.ch_dssi.isChecked())
-        settings.setValue("PluginDatabase/ShowLV2", self.ui.ch_lv2.isChecked())
-        settings.setValue("PluginDatabase/ShowVST2", self.ui.ch_vst.isChecked())
-        settings.setValue("PluginDatabase/ShowVST3", self.ui.ch_vst3.isChecked())
-        settings.setValue("PluginDatabase/ShowAU", self.ui.ch_au.isChecked())
-        settings.setValue("PluginDatabase/ShowKits", self.ui.ch_kits.isChecked())
-        settings.setValue("PluginDatabase/ShowNative", self.ui.ch_native.isChecked())
-        settings.setValue("PluginDatabase/ShowBridged", self.ui.ch_bridged.isChecked())
-        settings.setValue("PluginDatabase/ShowBridgedWine", self.ui.ch_bridged_wine.isChecked())
-        settings.setValue("PluginDatabase/ShowFavorites", self.ui.ch_favorites.isChecked())
-        settings.setValue("PluginDatabase/ShowRtSafe", self.ui.ch_rtsafe.isChecked())
-        settings.setValue("PluginDatabase/ShowHasCV", self.ui.ch_cv.isChecked())
-        settings.setValue("PluginDatabase/ShowHasGUI", self.ui.ch_gui.isChecked())
-        settings.setValue("PluginDatabase/ShowHasInlineDisplay", self.ui.ch_inline_display.isChecked())
-        settings.setValue("PluginDatabase/ShowStereoOnly", self.ui.ch_stereo.isChecked())
-        settings.setValue("PluginDatabase/SearchText", self.ui.lineEdit.text())
+        settings.beginGroup("PluginDatabase")
+
+        # only write what changed since the last load or save
+        for key, value in values.items():
+            if self.fSettingsCache.get(key) != value:
+                settings.setValue(key, value)
+                self.fSettingsCache[key] = value
 
         if self.fFavoritePluginsChanged:
-            settings.setValue("PluginDatabase/Favorites", self.fFavoritePlugins)
+            settings.setValue("Favorites", self.fFavoritePlugins)
+
+        settings.endGroup()
 
     # --------------------------------------------------------------------------------------------------------
 
     def loadSettings(self):
         settings = QSettings("falkTX", "CarlaDatabase2")
-        self.fFavoritePlugins = settings.value("PluginDatabase/Favorites", [], type=list)
+
+        # read the whole group at once, slot_saveSettings compares against this to skip unchanged keys
+        settings.beginGroup("PluginDatabase")
+        cache = dict((key, settings.value(key)) for key in settings.childKeys())
+        settings.endGroup()
+
+        self.fFavoritePlugins = toList(cache.pop("Favorites", []))
+        self.fFavoritePluginKeys = set(self._getFavoritePluginKey(fav) for fav in self.fFavoritePlugins)
         self.fFavoritePluginsChanged = False
 
-        self.restoreGeometry(settings.value("PluginDatabase/Geometry", b""))
-        self.ui.ch_effects.setChecked(settings.value("PluginDatabase/ShowEffects", True, type=bool))
-        self.ui.ch_instruments.setChecked(settings.value("PluginDatabase/ShowInstruments", True, type=bool))
-        self.ui.ch_midi.setChecked(settings.value("PluginDatabase/ShowMIDI", True, type=bool))
-        self.ui.ch_other.setChecked(settings.value("PluginDatabase/ShowOther", True, type=bool))
-        self.ui.ch_internal.setChecked(settings.value("PluginDatabase/ShowInternal", True, type=bool))
-        self.ui.ch_ladspa.setChecked(settings.value("PluginDatabase/ShowLADSPA", True, type=bool))
-        self.ui.ch_dssi.setChecked(settings.value("PluginDatabase/ShowDSSI", True, type=bool))
-        self.ui.ch_lv2.setChecked(settings.value("PluginDatabase/ShowLV2", True, type=bool))
-        self.ui.ch_vst.setChecked(settings.value("PluginDatabase/ShowVST2", True, type=bool))
-        self.ui.ch_vst3.setChecked(settings.value("PluginDatabase/ShowVST3", (MACOS or WINDOWS), type=bool))
-        self.ui.ch_au.setChecked(settings.value("PluginDatabase/ShowAU", MACOS, type=bool))
-        self.ui.ch_kits.setChecked(settings.value("PluginDatabase/ShowKits", True, type=bool))
-        self.ui.ch_native.setChecked(settings.value("PluginDatabase/ShowNative", True, type=bool))
-        self.ui.ch_bridged.setChecked(settings.value("PluginDatabase/ShowBridged", True, type=bool))
-        self.ui.ch_bridged_wine.setChecked(settings.value("PluginDatabase/ShowBridgedWine", True, type=bool))
-        self.ui.ch_favorites.setChecked(settings.value("PluginDatabase/ShowFavorites", False, type=bool))
-        self.ui.ch_rtsafe.setChecked(settings.value("PluginDatabase/ShowRtSafe", False, type=bool))
-        self.ui.ch_cv.setChecked(settings.value("PluginDatabase/ShowHasCV", False, type=bool))
-        self.ui.ch_gui.setChecked(settings.value("PluginDatabase/ShowHasGUI", False, type=bool))
-        self.ui.ch_inline_display.setChecked(settings.value("PluginDatabase/ShowHasInlineDisplay", False, type=bool))
-        self.ui.ch_stereo.setChecked(settings.value("PluginDatabase/ShowStereoOnly", False, type=bool))
-        self.ui.lineEdit.setText(settings.value("PluginDatabase/SearchText", "", type=str))
-
-        tableGeometry = settings.value("PluginDatabase/TableGeometry_6")
+        self.restoreGeometry(cache.get("Geometry", b""))
+
+        for key, check, default in self.fShowSettings:
+            cache[key] = valueToBool(cache.get(key, default))
+            check.setChecked(cache[key])
+
+        cache["SearchText"] = str(cache.get("SearchText", ""))
+        self.ui.lineEdit.setText(cache["SearchText"])
+
+        self.fSettingsCache = cache
+
+        tableGeometry = cache.get("TableGeometry_6")
         horizontalHeader = self.ui.tableWidget.horizontalHeader()
         if tableGeometry:
             horizontalHeader.restoreState(tableGeometry)
@@ -1747,118 +2143,74 @@ class PluginDatabaseW(QDialog):
             'uniqueId': plugin['uniqueId'],
         }
 
+    # hashable version of the above, for quick lookups in fFavoritePluginKeys
+    def _getFavoritePluginKey(self, plugin):
+        return (plugin.get('name'), plugin.get('build'), plugin.get('type'),
+                plugin.get('filename'), plugin.get('label'), plugin.get('uniqueId'))
+
     def _checkFilters(self):
+        # this might run before a pending text change, no need to filter again
+        self.fFilterTimer.stop()
+
         text = self.ui.lineEdit.text().lower()
 
-        hideEffects     = not self.ui.ch_effects.isChecked()
-        hideInstruments = not self.ui.ch_instruments.isChecked()
-        hideMidi        = not self.ui.ch_midi.isChecked()
-        hideOther       = not self.ui.ch_other.isChecked()
-
-        hideInternal = not self.ui.ch_internal.isChecked()
-        hideLadspa   = not self.ui.ch_ladspa.isChecked()
-        hideDssi     = not self.ui.ch_dssi.isChecked()
-        hideLV2      = not self.ui.ch_lv2.isChecked()
-        hideVST2     = not self.ui.ch_vst.isChecked()
-        hideVST3     = not self.ui.ch_vst3.isChecked()
-        hideAU       = not self.ui.ch_au.isChecked()
-        hideKits     = not self.ui.ch_kits.isChecked()
-
-        hideNative  = not self.ui.ch_native.isChecked()
-        hideBridged = not self.ui.ch_bridged.isChecked()
-        hideBridgedWine = not self.ui.ch_bridged_wine.isChecked()
-
-        hideNonFavs   = self.ui.ch_favorites.isChecked()
-        hideNonRtSafe = self.ui.ch_rtsafe.isChecked()
-        hideNonCV     = self.ui.ch_cv.isChecked()
-        hideNonGui    = self.ui.ch_gui.isChecked()
-        hideNonIDisp  = self.ui.ch_inline_display.isChecked()
-        hideNonStereo = self.ui.ch_stereo.isChecked()
-
-        if HAIKU or LINUX or MACOS:
-            nativeBins = [BINARY_POSIX32, BINARY_POSIX64]
-            wineBins   = [BINARY_WIN32, BINARY_WIN64]
-        elif WINDOWS:
-            nativeBins = [BINARY_WIN32, BINARY_WIN64]
-            wineBins   = []
-        else:
-            nativeBins = []
-            wineBins   = []
-
-        rowCount = self.ui.tableWidget.rowCount()
-
-        for i in range(self.fLastTableIndex):
-            plugin = self.ui.tableWidget.item(i, self.TABLEWIDGET_ITEM_NAME).data(Qt.UserRole+1)
-            ptext  = self.ui.tableWidget.item(i, self.TABLEWIDGET_ITEM_NAME).data(Qt.UserRole+2)
-            aIns   = plugin['audio.ins']
-            aOuts  = plugin['audio.outs']
-            cvIns  = plugin['cv.ins']
-            cvOuts = plugin['cv.outs']
-            mIns   = plugin['midi.ins']
-            mOuts  = plugin['midi.outs']
-            phints = plugin['hints']
-            ptype  = plugin['type']
-            isSynth  = bool(phints & PLUGIN_IS_SYNTH)
-            isEffect = bool(aIns > 0 < aOuts and not isSynth)
-            isMidi   = bool(aIns == 0 and aOuts == 0 and mIns > 0 < mOuts)
-            isKit    = bool(ptype in (PLUGIN_SF2, PLUGIN_SFZ))
-            isOther  = bool(not (isEffect or isSynth or isMidi or isKit))
-            isNative = bool(plugin['build'] == BINARY_NATIVE)
-            isRtSafe = bool(phints & PLUGIN_IS_RTSAFE)
-            isStereo = bool(aIns == 2 and aOuts == 2) or (isSynth and aOuts == 2)
-            hasCV    = bool(cvIns + cvOuts > 0)
-            hasGui   = bool(phints & PLUGIN_HAS_CUSTOM_UI)
-            hasIDisp = bool(phints & PLUGIN_HAS_INLINE_DISPLAY)
-
-            isBridged = bool(not isNative and plugin['build'] in nativeBins)
-            isBridgedWine = bool(not isNative and plugin['build'] in wineBins)
-
-            if hideEffects and isEffect:
-                self.ui.tableWidget.hideRow(i)
-            elif hideInstruments and isSynth:
-                self.ui.tableWidget.hideRow(i)
-            elif hideMidi and isMidi:
-                self.ui.tableWidget.hideRow(i)
-            elif hideOther and isOther:
-                self.ui.tableWidget.hideRow(i)
-            elif hideKits and isKit:
-                self.ui.tableWidget.hideRow(i)
-            elif hideInternal and ptype == PLUGIN_INTERNAL:
-                self.ui.tableWidget.hideRow(i)
-            elif hideLadspa and ptype == PLUGIN_LADSPA:
-                self.ui.tableWidget.hideRow(i)
-            elif hideDssi and ptype == PLUGIN_DSSI:
-                self.ui.tableWidget.hideRow(i)
-            elif hideLV2 and ptype == PLUGIN_LV2:
-                self.ui.tableWidget.hideRow(i)
-            elif hideVST2 and ptype == PLUGIN_VST2:
-                self.ui.tableWidget.hideRow(i)
-            elif hideVST3 and ptype == PLUGIN_VST3:
-                self.ui.tableWidget.hideRow(i)
-            elif hideAU and ptype == PLUGIN_AU:
-                self.ui.tableWidget.hideRow(i)
-            elif hideNative and isNative:
-                self.ui.tableWidget.hideRow(i)
-            elif hideBridged and isBridged:
-                self.ui.tableWidget.hideRow(i)
-            elif hideBridgedWine and isBridgedWine:
-                self.ui.tableWidget.hideRow(i)
-            elif hideNonRtSafe and not isRtSafe:
-                self.ui.tableWidget.hideRow(i)
-            elif hideNonCV and not hasCV:
-                self.ui.tableWidget.hideRow(i)
-            elif hideNonGui and not hasGui:
-                self.ui.tableWidget.hideRow(i)
-            elif hideNonIDisp and not hasIDisp:
-                self.ui.tableWidget.hideRow(i)
-            elif hideNonStereo and not isStereo:
-                self.ui.tableWidget.hideRow(i)
-            elif text and not all(t in ptext for t in text.strip().split(' ')):
-                self.ui.tableWidget.hideRow(i)
-            elif hideNonFavs and self._createFavoritePluginDict(plugin) not in self.fFavoritePlugins:
-                self.ui.tableWidget.hideRow(i)
-            else:
-                self.ui.tableWidget.showRow(i)
+        # rows with any of these are hidden
+        hideMask = 0
+        if not self.ui.ch_effects.isChecked():      hideMask |= self.FILTER_EFFECT
+        if not self.ui.ch_instruments.isChecked():  hideMask |= self.FILTER_INSTRUMENT
+        if not self.ui.ch_midi.isChecked():         hideMask |= self.FILTER_MIDI
+        if not self.ui.ch_other.isChecked():        hideMask |= self.FILTER_OTHER
+        if not self.ui.ch_kits.isChecked():         hideMask |= self.FILTER_KIT
+        if not self.ui.ch_internal.isChecked():     hideMask |= self.FILTER_INTERNAL
+        if not self.ui.ch_ladspa.isChecked():       hideMask |= self.FILTER_LADSPA
+        if not self.ui.ch_dssi.isChecked():         hideMask |= self.FILTER_DSSI
+        if not self.ui.ch_lv2.isChecked():          hideMask |= self.FILTER_LV2
+        if not self.ui.ch_vst.isChecked():          hideMask |= self.FILTER_VST2
+        if not self.ui.ch_vst3.isChecked():         hideMask |= self.FILTER_VST3
+        if not self.ui.ch_au.isChecked():           hideMask |= self.FILTER_AU
+        if not self.ui.ch_native.isChecked():       hideMask |= self.FILTER_NATIVE
+        if not self.ui.ch_bridged.isChecked():      hideMask |= self.FILTER_BRIDGED
+        if not self.ui.ch_bridged_wine.isChecked(): hideMask |= self.FILTER_BRIDGED_WINE
+
+        # rows without all of these are hidden
+        requireMask = 0
+        if self.ui.ch_rtsafe.isChecked():         requireMask |= self.FILTER_RTSAFE
+        if self.ui.ch_cv.isChecked():             requireMask |= self.FILTER_CV
+        if self.ui.ch_gui.isChecked():            requireMask |= self.FILTER_GUI
+        if self.ui.ch_inline_display.isChecked(): requireMask |= self.FILTER_INLINE_DISPLAY
+        if self.ui.ch_stereo.isChecked():         requireMask |= self.FILTER_STEREO
+
+        hideNonFavs = self.ui.ch_favorites.isChecked()
+
+        # nothing changed since the last pass
+        filterState = (hideMask, requireMask, hideNonFavs)
+        if filterState == self.fLastFilterState and text == self.fLastFilterText:
+            return
+
+        # typing more of the same search can only hide rows, so only the visible ones need checking
+        narrowing   = filterState == self.fLastFilterState and text.startswith(self.fLastFilterText)
+        self.fLastFilterState = filterState
+        self.fLastFilterText  = text
+
+        # every word needs to be found
+        tokens = tuple(t for t in text.split(' ') if t)
+
+        tableWidget = self.ui.tableWidget
+
+        # repaint once at the end, _endBulkAdd already holds updates until the new rows are filtered.
+        # not using updatesEnabled() for this, it is also False while a parent widget holds updates
+        holdUpdates = not self.fBulkAdding
+
+        if holdUpdates:
+            tableWidget.setUpdatesEnabled(False)
+
+        try:
+            filterPluginRows(tableWidget, self.fLastTableIndex, self.fPluginRows, self.TABLEWIDGET_ITEM_NAME,
+                             hideMask, requireMask, tokens, hideNonFavs, self.fFavoritePluginKeys, narrowing)
+
+        finally:
+            if holdUpdates:
+                tableWidget.setUpdatesEnabled(True)
 
     # --------------------------------------------------------------------------------------------------------
 
@@ -1870,20 +2222,101 @@ class PluginDatabaseW(QDialog):
 
         index = self.fLastTableIndex
 
+        favKey  = self._getFavoritePluginKey(plugin)
         favItem = QTableWidgetItem()
-        favItem.setCheckState(Qt.Checked if self._createFavoritePluginDict(plugin) in self.fFavoritePlugins else Qt.Unchecked)
+        favItem.setCheckState(Qt.Checked if favKey in self.fFavoritePluginKeys else Qt.Unchecked)
 
         pluginText = (plugin['name']+plugin['label']+plugin['maker']+plugin['filename']).lower()
-        self.ui.tableWidget.setItem(index, self.TABLEWIDGET_ITEM_FAVORITE, favItem)
-        self.ui.tableWidget.setItem(index, self.TABLEWIDGET_ITEM_NAME, QTableWidgetItem(plugin['name']))
-        self.ui.tableWidget.setItem(index, self.TABLEWIDGET_ITEM_LABEL, QTableWidgetItem(plugin['label']))
-        self.ui.tableWidget.setItem(index, self.TABLEWIDGET_ITEM_MAKER, QTableWidgetItem(plugin['maker']))
-        self.ui.tableWidget.setItem(index, self.TABLEWIDGET_ITEM_BINARY, QTableWidgetItem(os.path.basename(plugin['filename'])))
-        self.ui.tableWidget.item(index, self.TABLEWIDGET_ITEM_NAME).setData(Qt.UserRole+1, plugin)
-        self.ui.tableWidget.item(index, self.TABLEWIDGET_ITEM_NAME).setData(Qt.UserRole+2, pluginText)
+
+        if plugin['hints'] & PLUGIN_IS_SYNTH:
+            pluginKind = "Instrument"
+        elif plugin['audio.ins'] > 0 < plugin['audio.outs']:
+            pluginKind = "Effect"
+        elif plugin['audio.ins'] == 0 and plugin['audio.outs'] == 0 and plugin['midi.ins'] > 0 < plugin['midi.outs']:
+            pluginKind = "MIDI Plugin"
+        else:
+            pluginKind = "Other"
+
+        pluginFlags = self._getPluginFilterFlags(plugin)
+
+        # the table only keeps an index to the plugin info, so filtering does not convert it from and to QVariant
+        nameItem = QTableWidgetItem(plugin['name'])
+        nameItem.setData(Qt.UserRole+1, index)
+
+        setItem = self.ui.tableWidget.setItem
+        setItem(index, self.TABLEWIDGET_ITEM_FAVORITE, favItem)
+        setItem(index, self.TABLEWIDGET_ITEM_NAME, nameItem)
+        setItem(index, self.TABLEWIDGET_ITEM_LABEL, QTableWidgetItem(plugin['label']))
+        setItem(index, self.TABLEWIDGET_ITEM_MAKER, QTableWidgetItem(plugin['maker']))
+        setItem(index, self.TABLEWIDGET_ITEM_BINARY, QTableWidgetItem(getPluginBaseName(plugin['filename'])))
+
+        self.fPluginRows.append({
+            'plugin': plugin,
+            'text'  : pluginText,
+            'kind'  : pluginKind,
+            'flags' : pluginFlags,
+            'favKey': favKey,
+        })
 
         self.fLastTableIndex += 1
 
+    def _getPluginFilterFlags(self, plugin):
+        aIns   = plugin['audio.ins']
+        aOuts  = plugin['audio.outs']
+        cvIns  = plugin['cv.ins']
+        cvOuts = plugin['cv.outs']
+        mIns   = plugin['midi.ins']
+        mOuts  = plugin['midi.outs']
+        phints = plugin['hints']
+        ptype  = plugin['type']
+        pbuild = plugin['build']
+        flags  = 0
+
+        isSynth  = bool(phints & PLUGIN_IS_SYNTH)
+        isEffect = bool(aIns > 0 < aOuts and not isSynth)
+        isMidi   = bool(aIns == 0 and aOuts == 0 and mIns > 0 < mOuts)
+        isKit    = bool(ptype in (PLUGIN_SF2, PLUGIN_SFZ))
+        isNative = bool(pbuild == BINARY_NATIVE)
+
+        if isEffect: flags |= self.FILTER_EFFECT
+        if isSynth:  flags |= self.FILTER_INSTRUMENT
+        if isMidi:   flags |= self.FILTER_MIDI
+        if isKit:    flags |= self.FILTER_KIT
+        if not (isEffect or isSynth or isMidi or isKit):
+            flags |= self.FILTER_OTHER
+
+        if ptype == PLUGIN_INTERNAL: flags |= self.FILTER_INTERNAL
+        elif ptype == PLUGIN_LADSPA: flags |= self.FILTER_LADSPA
+        elif ptype == PLUGIN_DSSI:   flags |= self.FILTER_DSSI
+        elif ptype == PLUGIN_LV2:    flags |= self.FILTER_LV2
+        elif ptype == PLUGIN_VST2:   flags |= self.FILTER_VST2
+        elif ptype == PLUGIN_VST3:   flags |= self.FILTER_VST3
+        elif ptype == PLUGIN_AU:     flags |= self.FILTER_AU
+
+        if isNative:
+            flags |= self.FILTER_NATIVE
+        elif pbuild in kBridgedNativeBinaries:
+            flags |= self.FILTER_BRIDGED
+        elif pbuild in kBridgedWineBinaries:
+            flags |= self.FILTER_BRIDGED_WINE
+
+        if phints & PLUGIN_IS_RTSAFE:
+            flags |= self.FILTER_RTSAFE
+        if cvIns + cvOuts > 0:
+            flags |= self.FILTER_CV
+        if phints & PLUGIN_HAS_CUSTOM_UI:
+            flags |= self.FILTER_GUI
+        if phints & PLUGIN_HAS_INLINE_DISPLAY:
+            flags |= self.FILTER_INLINE_DISPLAY
+        if (aIns == 2 and aOuts == 2) or (isSynth and aOuts == 2):
+            flags |= self.FILTER_STEREO
+
+        return flags
+
+    # plugin info for a table row, which might not be the order it was added in due to sorting
+    def _getPluginRow(self, row):
+        return self.fPluginRows[self.ui.tableWidget.item(row, self.TABLEWIDGET_ITEM_NAME).data(Qt.UserRole+1)]
+
     # --------------------------------------------------------------------------------------------------------
 
     def _reAddInternalHelper(self, settingsDB, ptype, path):
@@ -1902,7 +2335,7 @@ class PluginDatabaseW(QDialog):
         else:
             return 0
 
-        plugins     = toList(settingsDB.value("Plugins/" + ptypeStr, []))
+        plugins     = loadPluginList(settingsDB, ptypeStr)
         pluginCount = settingsDB.value("PluginCount/" + ptypeStr, 0, type=int)
 
         pluginCountNew = gCarla.utils.get_cached_plugin_count(ptype, path)
@@ -1913,20 +2346,21 @@ class PluginDatabaseW(QDialog):
 
             QApplication.processEvents(QEventLoop.ExcludeUserInputEvents, 50)
 
+            getCachedPluginInfo = gCarla.utils.get_cached_plugin_info
+
             for i in range(pluginCountNew):
-                descInfo = gCarla.utils.get_cached_plugin_info(ptype, i)
+                descInfo = getCachedPluginInfo(ptype, i)
 
                 if not descInfo['valid']:
                     continue
 
-                info = checkPluginCached(descInfo, ptype)
-
-                plugins.append(info)
+                plugins.append(checkPluginCached(descInfo, ptype))
 
-                if i % 50 == 0:
-                    QApplication.processEvents(QEventLoop.ExcludeUserInputEvents, 50)
+                # event processing is costly, only do it every 256 plugins
+                if i & 0xFF == 0:
+                    QApplication.processEvents(QEventLoop.ExcludeUserInputEvents, 10)
 
-            settingsDB.setValue("Plugins/" + ptypeStr, plugins)
+            savePluginList(ptypeStr, plugins)
             settingsDB.setValue("PluginCount/" + ptypeStr, pluginCount)
 
         # prepare rows in advance
@@ -1939,12 +2373,15 @@ class PluginDatabaseW(QDialog):
 
     def _reAddPlugins(self):
         settingsDB = QSettings("falkTX", "CarlaPlugins4")
+        migratePluginLists(settingsDB)
 
-        for x in range(self.ui.tableWidget.rowCount()):
-            self.ui.tableWidget.removeRow(0)
+        self._beginBulkAdd()
+
+        self.ui.tableWidget.clearContents()
+        self.ui.tableWidget.setRowCount(0)
 
         self.fLastTableIndex = 0
-        self.ui.tableWidget.setSortingEnabled(False)
+        self.fPluginRows = []
 
         settings = QSettings("falkTX", "Carla2")
         LV2_PATH = splitter.join(toList(settings.value(CARLA_KEY_PATHS_LV2, CARLA_DEFAULT_LV2_PATH)))
@@ -1961,52 +2398,52 @@ class PluginDatabaseW(QDialog):
         # LADSPA
 
         ladspaPlugins  = []
-        ladspaPlugins += toList(settingsDB.value("Plugins/LADSPA_native", []))
-        ladspaPlugins += toList(settingsDB.value("Plugins/LADSPA_posix32", []))
-        ladspaPlugins += toList(settingsDB.value("Plugins/LADSPA_posix64", []))
-        ladspaPlugins += toList(settingsDB.value("Plugins/LADSPA_win32", []))
-        ladspaPlugins += toList(settingsDB.value("Plugins/LADSPA_win64", []))
+        ladspaPlugins += loadPluginList(settingsDB, "LADSPA_native")
+        ladspaPlugins += loadPluginList(settingsDB, "LADSPA_posix32")
+        ladspaPlugins += loadPluginList(settingsDB, "LADSPA_posix64")
+        ladspaPlugins += loadPluginList(settingsDB, "LADSPA_win32")
+        ladspaPlugins += loadPluginList(settingsDB, "LADSPA_win64")
 
         # ----------------------------------------------------------------------------------------------------
         # DSSI
 
         dssiPlugins  = []
-        dssiPlugins += toList(settingsDB.value("Plugins/DSSI_native", []))
-        dssiPlugins += toList(settingsDB.value("Plugins/DSSI_posix32", []))
-        dssiPlugins += toList(settingsDB.value("Plugins/DSSI_posix64", []))
-        dssiPlugins += toList(settingsDB.value("Plugins/DSSI_win32", []))
-        dssiPlugins += toList(settingsDB.value("Plugins/DSSI_win64", []))
+        dssiPlugins += loadPluginList(settingsDB, "DSSI_native")
+        dssiPlugins += loadPluginList(settingsDB, "DSSI_posix32")
+        dssiPlugins += loadPluginList(settingsDB, "DSSI_posix64")
+        dssiPlugins += loadPluginList(settingsDB, "DSSI_win32")
+        dssiPlugins += loadPluginList(settingsDB, "DSSI_win64")
 
         # ----------------------------------------------------------------------------------------------------
         # VST2
 
         vst2Plugins  = []
-        vst2Plugins += toList(settingsDB.value("Plugins/VST2_native", []))
-        vst2Plugins += toList(settingsDB.value("Plugins/VST2_posix32", []))
-        vst2Plugins += toList(settingsDB.value("Plugins/VST2_posix64", []))
-        vst2Plugins += toList(settingsDB.value("Plugins/VST2_win32", []))
-        vst2Plugins += toList(settingsDB.value("Plugins/VST2_win64", []))
+        vst2Plugins += loadPluginList(settingsDB, "VST2_native")
+        vst2Plugins += loadPluginList(settingsDB, "VST2_posix32")
+        vst2Plugins += loadPluginList(settingsDB, "VST2_posix64")
+        vst2Plugins += loadPluginList(settingsDB, "VST2_win32")
+        vst2Plugins += loadPluginList(settingsDB, "VST2_win64")
 
         # ----------------------------------------------------------------------------------------------------
         # VST3
 
         vst3Plugins  = []
-        vst3Plugins += toList(settingsDB.value("Plugins/VST3_native", []))
-        vst3Plugins += toList(settingsDB.value("Plugins/VST3_posix32", []))
-        vst3Plugins += toList(settingsDB.value("Plugins/VST3_posix64", []))
-        vst3Plugins += toList(settingsDB.value("Plugins/VST3_win32", []))
-        vst3Plugins += toList(settingsDB.value("Plugins/VST3_win64", []))
+        vst3Plugins += loadPluginList(settingsDB, "VST3_native")
+        vst3Plugins += loadPluginList(settingsDB, "VST3_posix32")
+        vst3Plugins += loadPluginList(settingsDB, "VST3_posix64")
+        vst3Plugins += loadPluginList(settingsDB, "VST3_win32")
+        vst3Plugins += loadPluginList(settingsDB, "VST3_win64")
 
         # ----------------------------------------------------------------------------------------------------
         # AU (extra non-cached)
 
-        auPlugins32 = toList(settingsDB.value("Plugins/AU_posix32", [])) if MACOS else []
+        auPlugins32 = loadPluginList(settingsDB, "AU_posix32") if MACOS else []
 
         # ----------------------------------------------------------------------------------------------------
         # Kits
 
-        sf2s = toList(settingsDB.value("Plugins/SF2", []))
-        sfzs = toList(settingsDB.value("Plugins/SFZ", []))
+        sf2s = loadPluginList(settingsDB, "SF2")
+        sfzs = loadPluginList(settingsDB, "SFZ")
 
         # ----------------------------------------------------------------------------------------------------
         # count plugins first, so we can create rows in advance
@@ -2078,10 +2515,37 @@ class PluginDatabaseW(QDialog):
 
         # ----------------------------------------------------------------------------------------------------
 
-        self.ui.tableWidget.setSortingEnabled(True)
-        self._checkFilters()
+        self._endBulkAdd()
         self.slot_checkPlugin(self.ui.tableWidget.currentRow())
 
+    # fill the whole table without sorting, repainting or emitting cell signals for each row
+    def _beginBulkAdd(self):
+        tableWidget = self.ui.tableWidget
+        self.fSortIndicatorShown = tableWidget.horizontalHeader().isSortIndicatorShown()
+
+        # all rows are new, they need a full filter pass
+        self.fLastFilterState = None
+        self.fBulkAdding = True
+
+        tableWidget.setUpdatesEnabled(False)
+        tableWidget.blockSignals(True)
+        tableWidget.setSortingEnabled(False)
+        tableWidget.horizontalHeader().setSortIndicatorShown(False)
+
+    # sort and filter the new rows once, then repaint
+    def _endBulkAdd(self):
+        tableWidget = self.ui.tableWidget
+
+        tableWidget.blockSignals(False)
+        tableWidget.horizontalHeader().setSortIndicatorShown(self.fSortIndicatorShown)
+        tableWidget.setSortingEnabled(True)
+
+        self._checkFilters()
+
+        self.fBulkAdding = False
+        tableWidget.setUpdatesEnabled(True)
+        tableWidget.viewport().update()
+
     # --------------------------------------------------------------------------------------------------------
 
     def showEvent(self, event):
@@ -2095,6 +2559,29 @@ class PluginDatabaseW(QDialog):
 # ---------------------------------------------------------------------------------------------------------------------
 # Jack Application Dialog
 
+# created on first use and shared by every dialog instance, instead of opening the settings for each load and save
+gJackAppSettings = None
+
+def getJackAppSettings():
+    global gJackAppSettings
+
+    if gJackAppSettings is None:
+        # always an ini file, so Windows does not go through the registry
+        gJackAppSettings = QSettings(QSettings.IniFormat, QSettings.UserScope, "falkTX", "CarlaAddJackApp")
+
+        # copy what older versions saved in the native format, only needed once
+        if not gJackAppSettings.allKeys():
+            oldSettings = QSettings("falkTX", "CarlaAddJackApp")
+            for key in oldSettings.allKeys():
+                gJackAppSettings.setValue(key, oldSettings.value(key))
+
+        # the instance lives on until the interpreter exits, make sure pending changes are written before that
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(gJackAppSettings.sync)
+
+    return gJackAppSettings
+
 class JackApplicationW(QDialog):
     SESSION_MGR_NONE   = 0
     SESSION_MGR_AUTO   = 1
@@ -2122,6 +2609,28 @@ class JackApplicationW(QDialog):
             # kdevelop likes this :)
             self.host = host = CarlaHostNull()
 
+        # check the command once the user stops typing, instead of on every key press
+        self.fCheckTimer = QTimer(self)
+        self.fCheckTimer.setSingleShot(True)
+        self.fCheckTimer.setInterval(120)
+
+        # settings key, widget and default value, the session manager is handled separately
+        self.fLineEditSettings = (
+            ("Command", self.ui.le_command, ""),
+            ("Name", self.ui.le_name, ""),
+        )
+        self.fSpinBoxSettings = (
+            ("NumAudioIns", self.ui.sb_audio_ins, 2),
+            ("NumAudioOuts", self.ui.sb_audio_outs, 2),
+            ("NumMidiIns", self.ui.sb_midi_ins, 0),
+            ("NumMidiOuts", self.ui.sb_midi_outs, 0),
+        )
+        self.fCheckBoxSettings = (
+            ("ManageWindow", self.ui.cb_manage_window, True),
+            ("CaptureFirstWindow", self.ui.cb_capture_first_window, False),
+            ("MidiOutMixdown", self.ui.cb_out_midi_mixdown, False),
+        )
+
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
 
         # --------------------------------------------------------------------------------------------------------------
@@ -2133,8 +2642,9 @@ class JackApplicationW(QDialog):
         # Set-up connections
 
         self.finished.connect(self.slot_saveSettings)
-        self.ui.cb_session_mgr.currentIndexChanged.connect(self.slot_sessionManagerChanged)
+        self.ui.cb_session_mgr.currentIndexChanged.connect(self.slot_checkButtonBox)
         self.ui.le_command.textChanged.connect(self.slot_commandChanged)
+        self.fCheckTimer.timeout.connect(self.slot_checkButtonBox)
 
     # -----------------------------------------------------------------------------------------------------------------
 
@@ -2183,9 +2693,9 @@ class JackApplicationW(QDialog):
         self.ui.buttonBox.button(QDialogButtonBox.Ok).setEnabled(enabled)
 
     def loadSettings(self):
-        settings = QSettings("falkTX", "CarlaAddJackApp")
+        value = getJackAppSettings().value
 
-        smName = settings.value("SessionManager", "", type=str)
+        smName = value("SessionManager", "", type=str)
 
         if smName == "LADISH (SIGUSR1)":
             self.ui.cb_session_mgr.setCurrentIndex(self.UI_SESSION_LADISH)
@@ -2194,16 +2704,17 @@ class JackApplicationW(QDialog):
         else:
             self.ui.cb_session_mgr.setCurrentIndex(self.UI_SESSION_NONE)
 
-        self.ui.le_command.setText(settings.value("Command", "", type=str))
-        self.ui.le_name.setText(settings.value("Name", "", type=str))
-        self.ui.sb_audio_ins.setValue(settings.value("NumAudioIns", 2, type=int))
-        self.ui.sb_audio_ins.setValue(settings.value("NumAudioIns", 2, type=int))
-        self.ui.sb_audio_outs.setValue(settings.value("NumAudioOuts", 2, type=int))
-        self.ui.sb_midi_ins.setValue(settings.value("NumMidiIns", 0, type=int))
-        self.ui.sb_midi_outs.setValue(settings.value("NumMidiOuts", 0, type=int))
-        self.ui.cb_manage_window.setChecked(settings.value("ManageWindow", True, type=bool))
-        self.ui.cb_capture_first_window.setChecked(settings.value("CaptureFirstWindow", False, type=bool))
-        self.ui.cb_out_midi_mixdown.setChecked(settings.value("MidiOutMixdown", False, type=bool))
+        for key, lineEdit, default in self.fLineEditSettings:
+            lineEdit.setText(value(key, default, type=str))
+
+        for key, spinBox, default in self.fSpinBoxSettings:
+            spinBox.setValue(value(key, default, type=int))
+
+        for key, check, default in self.fCheckBoxSettings:
+            check.setChecked(valueToBool(value(key, default)))
+
+        # what the widgets show right after loading, as if it had just been saved
+        self.fSettingsCache = self._getSettingsValues()
 
         self.checkIfButtonBoxShouldBeEnabled(self.ui.cb_session_mgr.currentIndex(),
                                              self.ui.le_command.text())
@@ -2212,31 +2723,43 @@ class JackApplicationW(QDialog):
 
     @pyqtSlot(str)
     def slot_commandChanged(self, text):
-        self.checkIfButtonBoxShouldBeEnabled(self.ui.cb_session_mgr.currentIndex(), text)
+        self.fCheckTimer.start()
 
-    @pyqtSlot(int)
-    def slot_sessionManagerChanged(self, index):
-        self.checkIfButtonBoxShouldBeEnabled(index, self.ui.le_command.text())
+    @pyqtSlot()
+    def slot_checkButtonBox(self):
+        self.fCheckTimer.stop()
+        self.checkIfButtonBoxShouldBeEnabled(self.ui.cb_session_mgr.currentIndex(), self.ui.le_command.text())
 
     @pyqtSlot()
     def slot_saveSettings(self):
-        settings = QSettings("falkTX", "CarlaAddJackApp")
-        settings.setValue("Command", self.ui.le_command.text())
-        settings.setValue("Name", self.ui.le_name.text())
-        settings.setValue("SessionManager", self.ui.cb_session_mgr.currentText())
-        settings.setValue("NumAudioIns", self.ui.sb_audio_ins.value())
-        settings.setValue("NumAudioOuts", self.ui.sb_audio_outs.value())
-        settings.setValue("NumMidiIns", self.ui.sb_midi_ins.value())
-        settings.setValue("NumMidiOuts", self.ui.sb_midi_outs.value())
-        settings.setValue("ManageWindow", self.ui.cb_manage_window.isChecked())
-        settings.setValue("CaptureFirstWindow", self.ui.cb_capture_first_window.isChecked())
-        settings.setValue("MidiOutMixdown", self.ui.cb_out_midi_mixdown.isChecked())
+        setValue = getJackAppSettings().setValue
+        cache    = self.fSettingsCache
+
+        # only write what changed since the last load or save
+        for key, value in self._getSettingsValues().items():
+            if cache.get(key) != value:
+                setValue(key, value)
+                cache[key] = value
+
+    def _getSettingsValues(self):
+        values = {
+            "SessionManager": self.ui.cb_session_mgr.currentText(),
+        }
+        values.update((key, lineEdit.text()) for key, lineEdit, default in self.fLineEditSettings)
+        values.update((key, spinBox.value()) for key, spinBox, default in self.fSpinBoxSettings)
+        values.update((key, check.isChecked()) for key, check, default in self.fCheckBoxSettings)
+        return values
 
     # -----------------------------------------------------------------------------------------------------------------
 
     def done(self, r):
+        # do not accept a command that the pending check would reject
+        if self.fCheckTimer.isActive():
+            self.slot_checkButtonBox()
+            if r == QDialog.Accepted and not self.ui.buttonBox.button(QDialogButtonBox.Ok).isEnabled():
+                return
+
         QDialog.done(self, r)
-        self.close()
 
 # ---------------------------------------------------------------------------------------------------------------------
 # Main